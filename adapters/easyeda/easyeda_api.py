@@ -7,7 +7,7 @@ from uuid import UUID
 import requests
 
 import constants as const
-from adapters.search_engine import SearchEngine, Vendor
+from adapters.search_engine import SearchEngine, Vendor, get_http_session
 from models.common_info import FootprintInfo, ImageInfo
 from models.search_result import SearchResult
 from svg_utils import render_svg_file_to_png_file
@@ -31,7 +31,7 @@ class EasyEDAApi(SearchEngine):
         }
 
     def get_step_3d_model(self, uuid: str) -> bytes:
-        r = requests.get(
+        r = get_http_session().get(
             url=ENDPOINT_3D_MODEL_STEP.format(uuid=uuid),
             headers={"User-Agent": self.headers["User-Agent"]},
         )
@@ -46,7 +46,9 @@ class EasyEDAApi(SearchEngine):
         cached_data = self._load_from_cache(cache_path)
         if cached_data:
             return json.loads(cached_data)
-        r = requests.get(url=SVG_ENDPOINT.format(lcsc_id=lcsc_id), headers=self.headers)
+        r = get_http_session().get(
+            url=SVG_ENDPOINT.format(lcsc_id=lcsc_id), headers=self.headers
+        )
         if r.status_code == 200 and r.json().get("success"):
             self._save_to_cache(cache_path, r.content)
             return r.json()
@@ -162,7 +164,7 @@ class EasyEDAApi(SearchEngine):
         }
         headers = self.headers.copy()
         headers["Content-Type"] = "application/json"
-        r = requests.post(url=SEARCH_ENDPOINT, json=payload, headers=headers)
+        r = get_http_session().post(url=SEARCH_ENDPOINT, json=payload, headers=headers)
         if r.status_code != requests.codes.ok:
             return []
         raw_results = (
@@ -203,7 +205,9 @@ class EasyEDAApi(SearchEngine):
         if cached_data:
             return json.loads(cached_data)
 
-        r = requests.get(url=API_ENDPOINT.format(lcsc_id=lcsc_id), headers=self.headers)
+        r = get_http_session().get(
+            url=API_ENDPOINT.format(lcsc_id=lcsc_id), headers=self.headers
+        )
         if r.status_code == 200 and r.json().get("success"):
             cad_data = r.json().get("result")
             self._save_to_cache(cache_path, json.dumps(cad_data).encode("utf-8"))
@@ -1,14 +1,43 @@
 import hashlib
 import os
+import tempfile
+import threading
 from abc import ABC, abstractmethod
 from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from models.search_result import SearchResult
-from constants import CACHE_DIR, USER_AGENT
+from constants import CACHE_DIR, IMAGE_DOWNLOAD_TIMEOUT, USER_AGENT
+
+# One connection pool for every engine request, so repeated calls to the same
+# vendor host reuse kept-alive connections instead of a new TCP/TLS handshake
+# each. The pool is sized for the search, hydration and image worker threads.
+# Only the adapter is shared: a Session's cookie jar is not thread-safe, so
+# each thread gets its own Session mounted on it.
+_http_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+_thread_local = threading.local()
+
+
+# mkstemp creates files owner-only; cache files get the usual umask-derived
+# mode instead. Read once, as querying the umask briefly changes it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+CACHE_FILE_MODE = 0o666 & ~_UMASK
+
+
+def get_http_session() -> requests.Session:
+    """Returns the calling thread's Session, which uses the shared pool."""
+    session = getattr(_thread_local, "http_session", None)
+    if session is None:
+        session = requests.Session()
+        session.mount("https://", _http_adapter)
+        session.mount("http://", _http_adapter)
+        _thread_local.http_session = session
+    return session
 
 
 class Vendor(Enum):
@@ -44,7 +73,9 @@ class SearchEngine(ABC):
             "User-Agent": USER_AGENT,
         }
         try:
-            r = requests.get(url=image_url, headers=headers)
+            r = get_http_session().get(
+                url=image_url, headers=headers, timeout=IMAGE_DOWNLOAD_TIMEOUT
+            )
             if r.status_code == 200:
                 self._save_to_cache(cache_path, r.content)
                 return r.content, str(cache_path.resolve())
@@ -64,9 +95,24 @@ class SearchEngine(ABC):
         return CACHE_DIR / f"{name}.{extension}"
 
     def _load_from_cache(self, path: Path) -> Optional[bytes]:
-        if path.exists():
+        try:
             return path.read_bytes()
-        return None
+        except FileNotFoundError:
+            return None
 
     def _save_to_cache(self, path: Path, data: bytes):
-        path.write_bytes(data)
+        # Written beside the target and renamed into place, so an interrupted
+        # write never leaves a truncated file that later loads treat as a hit.
+        # Each writer gets its own temp file; pooled downloads may race.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.chmod(tmp_name, CACHE_FILE_MODE)
+            os.replace(tmp_name, path)
+        except Exception:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
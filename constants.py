@@ -40,6 +40,8 @@ WORKFLOW_MAPPING = {
 
 # --- API & Network ---
 USER_AGENT = "WebParts v0.1"
+# Seconds an image download may wait to connect or between received bytes
+IMAGE_DOWNLOAD_TIMEOUT = 15
 
 
 # --- UI Text ---
@@ -58,3 +60,34 @@ DEFAULT_VERSION = "0.1"
 DEFAULT_AUTHOR = "Fred Turkington"
 
 IMAGE_DIMENSIONS = 3200
+
+# Rendered previews are pre-scaled to this multiple of their view size so
+# zooming in still shows detail.
+PREVIEW_ZOOM_HEADROOM = 2
+
+# Hero images are decoded to at most this many pixels per side; the sidebar
+# hero view is about 250px tall and zooms to 1.5x, with room for HiDPI.
+HERO_PREVIEW_MAX_SIDE = 512
+
+# Symbol and footprint renders are downscaled to this once when shown, so
+# resizing the search page rescales from that copy instead of the full render
+PREVIEW_WORKING_MAX_SIDE = 1024
+
+# Threads LibraryManager uses to read part manifests while scanning the library
+PART_LOAD_WORKERS = 8
+
+# Decoded hero previews the library hydrator keeps for re-selected parts
+HERO_IMAGE_CACHE_SIZE = 64
+
+# Heroes of the top visible library rows decoded into that cache once the list
+# has loaded, so the first click usually skips the decode
+HERO_PREFETCH_COUNT = 20
+
+# QPixmapCache size in KB. Footprint and symbol previews are cached at full
+# size, so this keeps the four previews of a few dozen recent parts.
+PIXMAP_CACHE_LIMIT_KB = 128 * 1024
+
+# Threads the library element page downloads images on. Downloads mostly wait
+# on the network, so they get their own pool instead of holding global pool
+# threads that render and decode previews.
+IMAGE_DOWNLOAD_THREADS = 4
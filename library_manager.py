@@ -1,13 +1,15 @@
 import copy
 import json
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from PySide6.QtCore import QObject
 
-from constants import WEBPARTS_DIR, WebPartsFilename
+from constants import PART_LOAD_WORKERS, WEBPARTS_DIR, WebPartsFilename
 from models.elements import LibrePCBElement
 from models.library_part import LibraryPart
 from models.search_result import SearchResult
@@ -178,68 +180,63 @@ class LibraryManager(QObject):
 
     def get_all_parts(self) -> list[LibraryPart]:
         """Scans the library and returns a list of all parts."""
-        parts = []
+        return list(self.iter_parts())
+
+    def iter_parts(self) -> Iterator[LibraryPart]:
+        """Scans the library, yielding each part as soon as it is loaded."""
         if not WEBPARTS_DIR.exists():
-            return parts
+            return
 
-        for part_dir in WEBPARTS_DIR.iterdir():
-            if part_dir.is_dir():
-                # Construct the expected manifest path to check for existence
-                # We need a dummy part to get the path structure
-                temp_part = LibraryPart(
-                    uuid=part_dir.name,
-                    vendor="",
-                    part_name="",
-                    lcsc_id="",
-                    manufacturer="",
-                    mfr_part_number="",
-                    description="",
-                    full_description="",
-                )
-                manifest_path = temp_part.manifest_path
-                if manifest_path.exists():
-                    try:
-                        with open(manifest_path, "r") as f:
-                            part_data = json.load(f)
-                            part = LibraryPart.model_validate(part_data)
-
-                            # Status is determined ONLY from individual element manifests
-                            part.status.footprint = self._get_element_status(
-                                LibrePCBElement.PACKAGE, part.footprint.uuid
-                            )
-                            part.status.symbol = self._get_element_status(
-                                LibrePCBElement.SYMBOL, part.symbol.uuid
-                            )
-                            part.status.component = self._get_element_status(
-                                LibrePCBElement.COMPONENT, part.component.uuid
-                            )
-                            part.status.device = self._get_element_status(
-                                LibrePCBElement.DEVICE, part.uuid
-                            )
-
-                            # Hydrate remaining metadata and paths
-                            self._hydrate_part_info(part)
-
-                            parts.append(part)
-                    except (json.JSONDecodeError, TypeError) as e:
-                        logger.error(
-                            f"❌ Failed to load part from {manifest_path}: {e}"
-                        )
-
-        return parts
+        # scandir entries know their type from the directory read itself,
+        # so telling part folders from stray files costs no extra stat()
+        with os.scandir(WEBPARTS_DIR) as entries:
+            uuids = [entry.name for entry in entries if entry.is_dir()]
+
+        # Each part is a dozen small file reads; overlap them across threads.
+        # map() keeps directory order and hands parts back as they complete.
+        with ThreadPoolExecutor(max_workers=PART_LOAD_WORKERS) as executor:
+            for part in executor.map(self._load_part, uuids):
+                if part:
+                    yield part
 
     def get_part_by_uuid(self, uuid: str) -> Optional[LibraryPart]:
         """Retrieves a single, fully hydrated library part by its UUID."""
         if not uuid:
             return None
+        # Reads only this part's manifest rather than scanning the library
+        return self._load_part(uuid)
+
+    def _load_part(self, uuid: str) -> Optional[LibraryPart]:
+        """Loads and hydrates one part from its manifest, if it exists."""
+        manifest_path = WEBPARTS_DIR / uuid / WebPartsFilename.PART_MANIFEST.value
+        # A missing manifest just fails to open; no separate exists() stat
+        try:
+            with open(manifest_path, "r") as f:
+                part_data = json.load(f)
+                part = LibraryPart.model_validate(part_data)
+
+                # Status is determined ONLY from individual element manifests
+                part.status.footprint = self._get_element_status(
+                    LibrePCBElement.PACKAGE, part.footprint.uuid
+                )
+                part.status.symbol = self._get_element_status(
+                    LibrePCBElement.SYMBOL, part.symbol.uuid
+                )
+                part.status.component = self._get_element_status(
+                    LibrePCBElement.COMPONENT, part.component.uuid
+                )
+                part.status.device = self._get_element_status(
+                    LibrePCBElement.DEVICE, part.uuid
+                )
 
-        # This is inefficient as it iterates all parts, but it's simple.
-        # For a large library, a direct lookup would be better.
-        all_parts = self.get_all_parts()
-        for part in all_parts:
-            if part.uuid == uuid:
+                # Hydrate remaining metadata and paths
+                self._hydrate_part_info(part)
                 return part
-        return None
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.error(f"❌ Failed to load part from {manifest_path}: {e}")
+            return None
 
     def _hydrate_part_info(self, part: LibraryPart):
         """
@@ -276,23 +273,30 @@ class LibraryManager(QObject):
         lp_path = element.get_lp_path(element_uuid)
         wp_path = element.get_wp_path(element_uuid)
 
-        if not wp_path.exists():
+        # Runs for four elements of every part in a scan, so the manifest is
+        # opened directly instead of stat'ed first; only the .lp is stat'ed.
+        try:
+            with open(wp_path, "r") as f:
+                manifest_text = f.read()
+        except (FileNotFoundError, NotADirectoryError):
             # If the .wp file doesn't exist, but the .lp file does, it's an error.
             if lp_path.exists():
                 return StatusValue.ERROR
             # If neither exist, it's simply unavailable.
             return StatusValue.UNAVAILABLE
+        except IOError as e:
+            logger.error(f"Error reading status manifest {wp_path}: {e}")
+            return StatusValue.ERROR
 
         # If the .wp manifest exists, but the .lp file doesn't, it needs review.
         if not lp_path.exists():
             return StatusValue.NEEDS_REVIEW
 
         try:
-            with open(wp_path, "r") as f:
-                data = json.load(f)
-                status_value = data.get("status", "unknown")
-                return StatusValue(status_value)
-        except (json.JSONDecodeError, IOError, ValueError) as e:
+            data = json.loads(manifest_text)
+            status_value = data.get("status", "unknown")
+            return StatusValue(status_value)
+        except ValueError as e:
             logger.error(f"Error reading status manifest {wp_path}: {e}")
             return StatusValue.ERROR
 
@@ -463,10 +467,10 @@ class LibraryManager(QObject):
 
     def _update_element_manifest(
         self, element: LibrePCBElement, uuid: str, new_issues: List[ValidationMessage]
-    ):
+    ) -> ElementManifest:
         """
         Runs checks for an element and updates its .wp manifest file with
-        reconciled validation messages.
+        reconciled validation messages. Returns the manifest as written.
         """
         manifest_path = element.get_wp_path(uuid)
 
@@ -501,6 +505,7 @@ class LibraryManager(QObject):
         logger.info(
             f"Updated manifest for {element.value} {uuid} with {len(reconciled_messages)} issues and status {existing_manifest.status.value}."
         )
+        return new_manifest
 
     def set_footprint_manifest_status(
         self, library_part: LibraryPart, new_status: StatusValue
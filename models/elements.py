@@ -37,9 +37,7 @@ class LibrePCBElement(Enum):
     def get_element_name(self, uuid: str) -> Optional[str]:
         """Extract the element name from the .lp file."""
         lp_path = self.get_lp_path(uuid)
-        if not lp_path.exists():
-            return None
-
+        # A missing file just fails to open below; no separate exists() stat
         try:
             with open(lp_path, "r", encoding="utf-8") as f:
                 content = f.read()
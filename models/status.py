@@ -41,9 +41,15 @@ class Status(BaseModel):
 class ValidationSeverity(str, Enum):
     """Represents the severity of a validation message."""
 
-    ERROR = "ERROR"
-    WARNING = "WARNING"
-    HINT = "HINT"
+    def __new__(cls, value, icon):
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        obj.icon = icon
+        return obj
+
+    ERROR = ("ERROR", "❌")
+    WARNING = ("WARNING", "⚠️")
+    HINT = ("HINT", "💡")
 
 
 class ValidationSource(str, Enum):
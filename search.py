@@ -85,3 +85,14 @@ class Search:
         self, engine: SearchEngine, vendor: Vendor, image_url: str
     ) -> Optional[tuple[bytes, str]]:
         return engine.download_image_from_url(vendor, image_url)
+
+
+_shared_search: Optional[Search] = None
+
+
+def get_shared_search() -> Search:
+    """Returns the process-wide Search used by the UI, creating it on first use."""
+    global _shared_search
+    if _shared_search is None:
+        _shared_search = Search()
+    return _shared_search
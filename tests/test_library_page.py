@@ -124,14 +124,14 @@ def test_library_page_loads(app, temp_library):
 
 def test_library_part_lite_creation():
     """Test LibraryPartLite data structure"""
-    flags = {"footprint": True, "symbol": False, "component": True, "device": False}
+    icons = ("✔", "✘", "✔", "✘")
     lite = LibraryPartLite(
         "test-uuid",
         "TestVendor",
         "TestPart",
         "C12345",
         "Test description",
-        flags,
+        icons,
         "/path/to/hero.png",
     )
 
@@ -140,8 +140,8 @@ def test_library_part_lite_creation():
     assert lite.part_name == "TestPart"
     assert lite.lcsc_id == "C12345"
     assert lite.description == "Test description"
-    assert lite.status_flags["footprint"] is True
-    assert lite.status_flags["symbol"] is False
+    assert lite.status_icons[0] == "✔"
+    assert lite.status_icons[1] == "✘"
     assert lite.hero_path == "/path/to/hero.png"
 
 
@@ -172,19 +172,19 @@ def test_library_page_tree_population(app, temp_library):
         page = LibraryPage()
 
         # Create test data
-        flags = {"footprint": True, "symbol": True, "component": True, "device": False}
+        icons = ("✔", "✔", "✔", "✘")
         lite = LibraryPartLite(
             "test-uuid-1",
             "TestVendor",
             "TestPart1",
             "C12345",
             "Test description",
-            flags,
+            icons,
             "",
         )
 
         # Simulate parts loading
-        page.on_parts_loaded([lite])
+        page.on_parts_chunk([lite])
 
         # Check tree has been populated
         assert page.tree.topLevelItemCount() == 1
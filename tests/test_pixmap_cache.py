@@ -0,0 +1,125 @@
+import os
+
+import pytest
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QImage, QPixmapCache
+from PySide6.QtWidgets import QApplication
+
+from ui.pixmap_cache import (
+    cache_pixmap_from_image,
+    cached_pixmap,
+    cached_scaled_pixmap,
+    decode_scaled_image,
+    image_cache_key,
+    read_image_to_fit,
+    read_scaled_image,
+)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Create a single QApplication instance for the whole test session."""
+    q_app = QApplication.instance()
+    if not q_app:
+        q_app = QApplication([])
+    return q_app
+
+
+@pytest.fixture
+def png_path(app, tmp_path):
+    """Write a small PNG and start from an empty pixmap cache."""
+    QPixmapCache.clear()
+    path = tmp_path / "preview.png"
+    QImage(8, 4, QImage.Format_RGB32).save(str(path))
+    return path
+
+
+class TestCachedPixmap:
+    def test_missing_file_returns_null_pixmap(self, app, tmp_path):
+        assert cached_pixmap(tmp_path / "missing.png").isNull()
+        assert cached_pixmap(None).isNull()
+
+    def test_repeated_load_hits_cache(self, png_path):
+        first = cached_pixmap(png_path)
+        second = cached_pixmap(png_path)
+        assert first.width() == 8
+        assert first.cacheKey() == second.cacheKey()
+
+    def test_rewritten_file_is_reloaded(self, png_path):
+        first = cached_pixmap(png_path)
+        QImage(16, 4, QImage.Format_RGB32).save(str(png_path))
+        stat = os.stat(png_path)
+        os.utime(png_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = cached_pixmap(png_path)
+        assert second.width() == 16
+        assert first.cacheKey() != second.cacheKey()
+
+
+class TestCachedScaledPixmap:
+    def test_large_file_is_cached_at_max_side(self, app, tmp_path):
+        QPixmapCache.clear()
+        path = tmp_path / "render.png"
+        QImage(1000, 500, QImage.Format_RGB32).save(str(path))
+        first = cached_scaled_pixmap(path, 200)
+        second = cached_scaled_pixmap(path, 200)
+        assert (first.width(), first.height()) == (200, 100)
+        assert first.cacheKey() == second.cacheKey()
+        assert cached_pixmap(path).width() == 1000
+
+    def test_missing_file_returns_null_pixmap(self, app, tmp_path):
+        assert cached_scaled_pixmap(tmp_path / "missing.png", 200).isNull()
+
+
+class TestCachePixmapFromImage:
+    def test_inserted_image_is_found_by_cached_pixmap(self, png_path):
+        key = image_cache_key(png_path)
+        inserted = cache_pixmap_from_image(key, QImage(str(png_path)))
+        assert cached_pixmap(png_path).cacheKey() == inserted.cacheKey()
+
+    def test_missing_file_has_no_key(self, app, tmp_path):
+        assert image_cache_key(tmp_path / "missing.png") is None
+
+
+class TestReadScaledImage:
+    def test_large_image_is_decoded_to_max_side(self, app, tmp_path):
+        path = tmp_path / "hero.png"
+        QImage(1000, 500, QImage.Format_RGB32).save(str(path))
+        image = read_scaled_image(path, 200)
+        assert (image.width(), image.height()) == (200, 100)
+
+    def test_small_image_keeps_its_size(self, png_path):
+        image = read_scaled_image(png_path, 200)
+        assert (image.width(), image.height()) == (8, 4)
+
+    def test_image_is_premultiplied(self, png_path):
+        image = read_scaled_image(png_path, 200)
+        assert image.format() == QImage.Format_ARGB32_Premultiplied
+
+    def test_missing_file_returns_null_image(self, app, tmp_path):
+        assert read_scaled_image(tmp_path / "missing.png", 200).isNull()
+
+
+class TestReadImageToFit:
+    def test_image_fits_inside_bounds(self, app, tmp_path):
+        path = tmp_path / "render.png"
+        QImage(1000, 500, QImage.Format_RGB32).save(str(path))
+        image = read_image_to_fit(path, QSize(400, 100))
+        assert (image.width(), image.height()) == (200, 100)
+
+    def test_no_bounds_keeps_full_size(self, png_path):
+        assert read_image_to_fit(png_path, None).size() == QSize(8, 4)
+        assert read_image_to_fit(png_path, QSize()).size() == QSize(8, 4)
+
+
+class TestDecodeScaledImage:
+    def test_large_data_is_decoded_to_max_side(self, app, tmp_path):
+        path = tmp_path / "download.png"
+        QImage(600, 300, QImage.Format_RGB32).save(str(path))
+        image = decode_scaled_image(path.read_bytes(), 200)
+        assert (image.width(), image.height()) == (200, 100)
+        assert image.format() == QImage.Format_ARGB32_Premultiplied
+
+    def test_invalid_data_returns_null_image(self, app):
+        assert decode_scaled_image(b"not an image", 200).isNull()
+        assert decode_scaled_image(b"", 200).isNull()
@@ -1,4 +1,5 @@
 import os
+import stat
 import sys
 import pytest
 from unittest.mock import patch, Mock
@@ -8,7 +9,8 @@ import requests
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, project_root)
 
-from adapters.search_engine import SearchEngine, CACHE_DIR
+from adapters.search_engine import CACHE_FILE_MODE, SearchEngine, CACHE_DIR
+from constants import IMAGE_DOWNLOAD_TIMEOUT
 
 
 class DummyEngine(SearchEngine):
@@ -33,7 +35,7 @@ def cache_test_engine(tmp_path):
         yield engine
 
 
-@patch("adapters.search_engine.requests.get")
+@patch("requests.Session.get")
 def test_download_first_time(mock_get, cache_test_engine):
     """
     Test that an image is downloaded from the network and saved to cache
@@ -49,7 +51,9 @@ def test_download_first_time(mock_get, cache_test_engine):
     result = cache_test_engine.download_image_from_url("test_vendor", image_url)
 
     mock_get.assert_called_once_with(
-        url=image_url, headers={"User-Agent": "WebParts v0.1"}
+        url=image_url,
+        headers={"User-Agent": "WebParts v0.1"},
+        timeout=IMAGE_DOWNLOAD_TIMEOUT,
     )
     assert result is not None
     data, cache_path = result
@@ -60,7 +64,7 @@ def test_download_first_time(mock_get, cache_test_engine):
     assert expected_cache_file.read_bytes() == b"fake-image-data"
 
 
-@patch("adapters.search_engine.requests.get")
+@patch("requests.Session.get")
 def test_download_from_cache(mock_get, cache_test_engine):
     """
     Test that an image is loaded from the cache on the second request
@@ -80,7 +84,7 @@ def test_download_from_cache(mock_get, cache_test_engine):
     assert data == b"cached-data"
 
 
-@patch("adapters.search_engine.requests.get")
+@patch("requests.Session.get")
 def test_download_network_failure(mock_get, cache_test_engine):
     """
     Test that the download method handles network failures gracefully.
@@ -93,3 +97,23 @@ def test_download_network_failure(mock_get, cache_test_engine):
     assert result is None
     expected_cache_file = cache_test_engine._get_cache_path_for_image(image_url)
     assert not expected_cache_file.exists()
+
+
+def test_cache_write_is_atomic(cache_test_engine, tmp_path):
+    """
+    Test that a failed cache write leaves neither a partial file nor a
+    stray temp file behind.
+    """
+    cache_path = cache_test_engine._get_cache_path_for_image("http://x/a.png")
+
+    with (
+        patch("adapters.search_engine.os.replace", side_effect=OSError("disk full")),
+        pytest.raises(OSError),
+    ):
+        cache_test_engine._save_to_cache(cache_path, b"data")
+    assert list(tmp_path.iterdir()) == []
+
+    cache_test_engine._save_to_cache(cache_path, b"data")
+    assert list(tmp_path.iterdir()) == [cache_path]
+    assert cache_path.read_bytes() == b"data"
+    assert stat.S_IMODE(cache_path.stat().st_mode) == CACHE_FILE_MODE
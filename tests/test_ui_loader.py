@@ -0,0 +1,41 @@
+import pytest
+from PySide6.QtWidgets import QApplication, QTreeWidget
+
+from ui.hero_image_widget import HeroImageWidget
+from ui.part_info_widget import PartInfoWidget
+from ui.ui_loader import _ui_bytes, load_ui, named_children
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Create a single QApplication instance for the whole test session."""
+    q_app = QApplication.instance()
+    if not q_app:
+        q_app = QApplication([])
+    return q_app
+
+
+class TestLoadUi:
+    def test_loads_custom_widgets(self, app):
+        ui = load_ui("page_library.ui", None, (PartInfoWidget, HeroImageWidget))
+        assert ui is not None
+        assert ui.findChild(HeroImageWidget, "hero_image_widget") is not None
+        assert ui.findChild(QTreeWidget, "libraryTree") is not None
+
+    def test_repeat_loads_reuse_file_contents(self, app):
+        _ui_bytes.cache_clear()
+        first = load_ui("page_library.ui", None, (PartInfoWidget, HeroImageWidget))
+        second = load_ui("page_library.ui", None, (PartInfoWidget, HeroImageWidget))
+        assert first is not second
+        assert _ui_bytes.cache_info().hits == 1
+
+
+class TestNamedChildren:
+    def test_matches_find_child(self, app):
+        ui = load_ui("page_library.ui", None, (PartInfoWidget, HeroImageWidget))
+        widgets = named_children(ui)
+        assert widgets["libraryTree"] is ui.findChild(QTreeWidget, "libraryTree")
+        assert widgets["hero_image_widget"] is ui.findChild(
+            HeroImageWidget, "hero_image_widget"
+        )
+        assert "" not in widgets
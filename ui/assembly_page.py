@@ -1,7 +1,7 @@
 import logging
-import os
 from PySide6.QtWidgets import QWidget, QVBoxLayout
-from PySide6.QtUiTools import QUiLoader
+
+from .ui_loader import load_ui
 
 logger = logging.getLogger(__name__)
 
@@ -9,11 +9,7 @@ logger = logging.getLogger(__name__)
 class AssemblyPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        loader = QUiLoader()
-        ui_file_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "assembly_page.ui"
-        )
-        loaded_ui = loader.load(ui_file_path, self)
+        loaded_ui = load_ui("assembly_page.ui", self)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -1,10 +1,8 @@
-import os
 import logging
 from typing import Optional
 
 from PySide6.QtCore import QObject, Qt, QThread, Signal, Slot
 from PySide6.QtGui import QDesktopServices, QFont
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (
     QWidget,
     QTreeWidgetItem,
@@ -15,9 +13,16 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import QUrl
 
 from models.library_part import LibraryPart
-from models.status import StatusValue, ValidationMessage, ValidationSeverity
+from models.status import (
+    ElementManifest,
+    StatusValue,
+    ValidationMessage,
+    ValidationSeverity,
+)
 from models.elements import LibrePCBElement
 from library_manager import LibraryManager
+from workers.element_renderer import render_and_check_element
+from .ui_loader import load_ui
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +38,6 @@ class DeviceUpdateWorker(QObject):
     @Slot()
     def run(self):
         try:
-            from workers.element_renderer import render_and_check_element
-
             logger.info("Re-rendering and checking device...")
 
             # Re-render and check the device
@@ -67,8 +70,6 @@ class ComponentUpdateWorker(QObject):
     @Slot()
     def run(self):
         try:
-            from workers.element_renderer import render_and_check_element
-
             logger.info("Re-rendering and checking component...")
 
             # Re-render and check the component
@@ -99,11 +100,7 @@ class ComponentReviewPage(QWidget):
         self.library_manager = LibraryManager()
 
         # Load UI
-        loader = QUiLoader()
-        ui_file_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "component_review_page.ui"
-        )
-        self.ui_content = loader.load(ui_file_path, self)
+        self.ui_content = load_ui("component_review_page.ui", self)
 
         # Find widgets
         self._find_widgets()
@@ -217,13 +214,8 @@ class ComponentReviewPage(QWidget):
         manifest_path = LibrePCBElement.COMPONENT.get_wp_path(
             self.library_part.component.uuid
         )
-        if not manifest_path or not manifest_path.exists():
-            logger.warning("Cannot load component messages: manifest not loaded.")
-            return
-
+        # A missing manifest just fails to open; no separate exists() stat
         try:
-            from models.status import ElementManifest
-
             manifest = ElementManifest.model_validate_json(manifest_path.read_text())
 
             for msg in manifest.validation:
@@ -231,6 +223,8 @@ class ComponentReviewPage(QWidget):
                     msg, self.component_validation_tree
                 )
 
+        except (FileNotFoundError, NotADirectoryError):
+            logger.warning("Cannot load component messages: manifest not loaded.")
         except Exception as e:
             logger.error(f"Failed to load component validation messages: {e}")
 
@@ -243,18 +237,15 @@ class ComponentReviewPage(QWidget):
 
         # Read validation messages from device manifest (device uses main part UUID)
         manifest_path = LibrePCBElement.DEVICE.get_wp_path(self.library_part.uuid)
-        if not manifest_path or not manifest_path.exists():
-            logger.warning("Cannot load device messages: manifest not loaded.")
-            return
-
+        # A missing manifest just fails to open; no separate exists() stat
         try:
-            from models.status import ElementManifest
-
             manifest = ElementManifest.model_validate_json(manifest_path.read_text())
 
             for msg in manifest.validation:
                 self._add_validation_message_to_tree(msg, self.device_validation_tree)
 
+        except (FileNotFoundError, NotADirectoryError):
+            logger.warning("Cannot load device messages: manifest not loaded.")
         except Exception as e:
             logger.error(f"Failed to load device validation messages: {e}")
 
@@ -303,8 +294,6 @@ class ComponentReviewPage(QWidget):
             return
 
         try:
-            from models.status import ElementManifest
-
             # Collect all validation messages from the device tree
             messages = []
             for i in range(self.device_validation_tree.topLevelItemCount()):
@@ -335,8 +324,6 @@ class ComponentReviewPage(QWidget):
             return
 
         try:
-            from models.status import ElementManifest
-
             # Collect all validation messages from the component tree
             messages = []
             for i in range(self.component_validation_tree.topLevelItemCount()):
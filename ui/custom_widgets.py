@@ -1,12 +1,47 @@
 import logging
+from contextlib import contextmanager
 
-from PySide6.QtCore import QEvent, Qt, Signal
+from PySide6.QtCore import QEvent, Qt, QTimer, Signal
 from PySide6.QtGui import QMouseEvent, QNativeGestureEvent, QWheelEvent
-from PySide6.QtWidgets import QGraphicsScene, QGraphicsView, QLabel
+from PySide6.QtWidgets import (
+    QGraphicsItem,
+    QGraphicsScene,
+    QGraphicsView,
+    QLabel,
+    QTreeView,
+)
 
 log = logging.getLogger(__name__)
 
 
+@contextmanager
+def batched_view_updates(view: QGraphicsView):
+    """Holds off repaints of view inside the block; it repaints once on exit."""
+    view.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        view.setUpdatesEnabled(True)
+
+
+@contextmanager
+def batched_tree_updates(tree: QTreeView):
+    """
+    Suspends repaints, sorting and the tree's own signals inside the block, so
+    bulk row changes cost a single layout pass and report no selection changes.
+    """
+    was_sorting = tree.isSortingEnabled()
+    tree.setUpdatesEnabled(False)
+    tree.setSortingEnabled(False)
+    tree.blockSignals(True)
+    try:
+        yield
+    finally:
+        tree.blockSignals(False)
+        tree.setSortingEnabled(was_sorting)
+        tree.setUpdatesEnabled(True)
+
+
 class ClickableLabel(QLabel):
     """
     A custom QLabel that emits signals for clicks and double-clicks.
@@ -45,11 +80,25 @@ class ZoomPanGraphicsView(QGraphicsView):
         # Hide the scrollbars so they don't clutter the UI.
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # Scenes here hold a single image, so skip painter state saves and let
+        # Qt pick the cheapest repaint region.
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
 
         self._is_panning = False
         self._last_mouse_position = None
         self._initial_fit_done = False
         self._is_at_fit_zoom = True  # Track if we're at "fit to view" zoom level
+        # What a refit fits and how far it then zooms in; see fit_to_item
+        self._fit_item = None
+        self._fit_zoom = 1.0
+
+        # Coalesce bursts of resize events (e.g. dragging a splitter) into a
+        # single re-fit once the size has settled.
+        self._refit_timer = QTimer(self)
+        self._refit_timer.setSingleShot(True)
+        self._refit_timer.setInterval(20)
+        self._refit_timer.timeout.connect(self._refit_to_view)
 
     def event(self, event: QEvent) -> bool:
         """
@@ -220,16 +269,43 @@ class ZoomPanGraphicsView(QGraphicsView):
     def resizeEvent(self, event):
         """Override resizeEvent to maintain fit-in-view if user hasn't zoomed."""
         super().resizeEvent(event)
-        if not self._initial_fit_done and self.scene() and self.scene().items():
+        self._refit_timer.start()
+
+    def fit_to_item(self, item: QGraphicsItem, zoom_factor: float = 1.0):
+        """
+        Fits item in the view and zooms in by zoom_factor. Refits after later
+        resizes keep that item and zoom until the user zooms by hand.
+        """
+        self._fit_item = item
+        self._fit_zoom = zoom_factor
+        # A refit still queued from an earlier resize would undo the zoom
+        self._refit_timer.stop()
+        self._initial_fit_done = True
+        self._is_at_fit_zoom = True
+        self._apply_fit()
+
+    def _apply_fit(self):
+        if self._fit_item is not None:
+            self.fitInView(self._fit_item, Qt.KeepAspectRatio)
+        else:
             self.fitInView(self.scene().itemsBoundingRect(), Qt.KeepAspectRatio)
+        if self._fit_zoom != 1.0:
+            self.scale(self._fit_zoom, self._fit_zoom)
+
+    def _refit_to_view(self):
+        """Re-fits the scene after the view has finished resizing."""
+        if not self._initial_fit_done and self.scene() and self.scene().items():
+            self._apply_fit()
             self._initial_fit_done = True
             self._is_at_fit_zoom = True
         elif self._is_at_fit_zoom and self.scene() and self.scene().items():
             # User hasn't manually zoomed, so maintain the fit
-            self.fitInView(self.scene().itemsBoundingRect(), Qt.KeepAspectRatio)
+            self._apply_fit()
 
     def setScene(self, scene: QGraphicsScene):
         """Reset the initial fit flag when the scene changes."""
         self._initial_fit_done = False
         self._is_at_fit_zoom = True  # New scene starts at fit zoom
+        self._fit_item = None
+        self._fit_zoom = 1.0
         super().setScene(scene)
@@ -1,12 +1,10 @@
 import json
 import logging
-import os
 import subprocess
 import sys
 
-from PySide6.QtCore import Qt, QThread, QUrl, Signal
-from PySide6.QtGui import QDesktopServices, QPixmap
-from PySide6.QtUiTools import QUiLoader
+from PySide6.QtCore import QPoint, Qt, QThreadPool, QTimer, Signal, Slot
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import (
     QCheckBox,
     QGraphicsView,
@@ -21,21 +19,41 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from constants import UIText
 from library_manager import LibraryManager
 from models.elements import LibrePCBElement
 from models.library_part import LibraryPart
 from models.status import (
     ElementManifest,
     StatusValue,
-    ValidationSeverity,
     ValidationSource,
 )
 
-from .library_element_image_widget import LibraryElementImageWidget
+from .custom_widgets import batched_tree_updates
+from .library_element_image_widget import (
+    LibraryElementImageWidget,
+    preview_target_size,
+)
+from .ui_loader import load_ui
 from .ui_workers import ElementUpdateWorker
 
 logger = logging.getLogger(__name__)
 
+# Greys out the checkboxes of read-only (LibrePCB) messages
+MESSAGE_LIST_STYLESHEET = """
+    QCheckBox:disabled {
+        color: #909090;
+    }
+    QCheckBox::indicator:disabled {
+        background-color: #e0e0e0;
+    }
+"""
+
+# Command used to reveal a folder, by sys.platform; anything else uses xdg-open
+FILE_MANAGER_COMMANDS = {"darwin": ["open"], "win32": ["explorer"]}
+
+READONLY_MESSAGE_TOOLTIP = "This check is from LibrePCB and cannot be approved here."
+
 
 class FootprintReviewPage(QWidget):
     """
@@ -49,27 +67,34 @@ class FootprintReviewPage(QWidget):
         self.library_part = None
         self.manifest = None
         self.library_manager = LibraryManager()
-
-        loader = QUiLoader()
-        # Register the custom widget for promotion
-        loader.registerCustomWidget(LibraryElementImageWidget)
-        ui_file_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "footprint_review_page.ui"
+        # Message rows by manifest index, and the indices that currently carry
+        # a checkbox widget (only rows in the viewport do).
+        self._message_items = []
+        self._widgeted_rows = set()
+        # cacheKey() of the pixmap each preview is showing, to skip re-showing it
+        self._last_easyeda_key = None
+        self._last_librepcb_key = None
+
+        self.ui = load_ui(
+            "footprint_review_page.ui", self, (LibraryElementImageWidget,)
         )
-        self.ui = loader.load(ui_file_path, self)
+        # Index the loaded widget tree once instead of a findChild walk per lookup
+        self._ui_widgets = {
+            widget.objectName(): widget for widget in self.ui.findChildren(QWidget)
+        }
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self.ui)
 
-        self.vertical_splitter = self.ui.findChild(QSplitter, "vertical_splitter")
+        self.vertical_splitter = self._find_widget(QSplitter, "vertical_splitter")
         if self.vertical_splitter:
             # Set initial size ratio to 3:1 (images:messages)
             self.vertical_splitter.setSizes([300, 100])
         else:
             logger.error("Could not find 'vertical_splitter' in the UI.")
 
-        self.footprint_splitter = self.ui.findChild(QSplitter, "footprint_splitter")
+        self.footprint_splitter = self._find_widget(QSplitter, "footprint_splitter")
         if self.footprint_splitter:
             # Set initial size ratio to 1:1 (left:right)
             self.footprint_splitter.setSizes([200, 200])
@@ -79,7 +104,7 @@ class FootprintReviewPage(QWidget):
         self._setup_easyeda_preview()
 
         # The generated preview is now a custom widget promoted from the UI file
-        self.footprint_message_list = self.ui.findChild(
+        self.footprint_message_list = self._find_widget(
             QTreeWidget, "footprintMessageList"
         )
         if self.footprint_message_list:
@@ -92,19 +117,14 @@ class FootprintReviewPage(QWidget):
             self.footprint_message_list.setColumnWidth(0, 80)  # Approved
             self.footprint_message_list.setColumnWidth(1, 60)  # Severity
             self.footprint_message_list.setHeaderHidden(False)
-            self.footprint_message_list.setStyleSheet("""
-                QCheckBox:disabled {
-                    color: #909090;
-                }
-                QCheckBox::indicator:disabled {
-                    background-color: #e0e0e0;
-                 
-                }
-            """)
+            self.footprint_message_list.setStyleSheet(MESSAGE_LIST_STYLESHEET)
+            scroll_bar = self.footprint_message_list.verticalScrollBar()
+            scroll_bar.valueChanged.connect(self._ensure_widgets_for_visible)
+            scroll_bar.rangeChanged.connect(self._ensure_widgets_for_visible)
         else:
             logger.error("Could not find 'footprintMessageList' widget.")
 
-        self.librepcb_preview = self.ui.findChild(
+        self.librepcb_preview = self._find_widget(
             LibraryElementImageWidget, "librepcbFootprintView"
         )
         if self.librepcb_preview:
@@ -112,21 +132,21 @@ class FootprintReviewPage(QWidget):
         else:
             logger.error("Could not find 'librepcbFootprintView' widget.")
 
-        self.refresh_button = self.ui.findChild(QPushButton, "button_RefreshFootprint")
+        self.refresh_button = self._find_widget(QPushButton, "button_RefreshFootprint")
         if self.refresh_button:
             self.refresh_button.clicked.connect(self._on_refresh_checks_clicked)
         else:
             logger.error("Could not find 'button_RefreshFootprint' widget.")
 
         # Find header and UUID labels
-        self.header_label = self.ui.findChild(QLabel, "label_FootprintHeader")
-        self.uuid_label = self.ui.findChild(QLabel, "label_FootprintUUID")
+        self.header_label = self._find_widget(QLabel, "label_FootprintHeader")
+        self.uuid_label = self._find_widget(QLabel, "label_FootprintUUID")
         if self.uuid_label:
             self.uuid_label.linkActivated.connect(self._on_uuid_clicked)
         else:
             logger.error("Could not find 'label_FootprintUUID' widget.")
 
-        self.approve_button = self.ui.findChild(QPushButton, "button_ApproveFootprint")
+        self.approve_button = self._find_widget(QPushButton, "button_ApproveFootprint")
         if self.approve_button:
             self.approve_button.clicked.connect(self._on_approve_clicked)
         else:
@@ -182,25 +202,12 @@ class FootprintReviewPage(QWidget):
 
         logger.info(f"Opening package directory: {pkg_dir_absolute}")
 
-        # Use Qt's cross-platform method with absolute path
-        url = QUrl.fromLocalFile(str(pkg_dir_absolute))
-        success = QDesktopServices.openUrl(url)
-
-        if not success:
-            logger.warning("QDesktopServices failed, trying platform-specific method")
-            # Fall back to platform-specific method
-            try:
-                if sys.platform == "darwin":  # macOS
-                    subprocess.run(["open", str(pkg_dir_absolute)], check=True)
-                elif sys.platform == "win32":  # Windows
-                    subprocess.run(["explorer", str(pkg_dir_absolute)], check=True)
-                else:  # Linux and others
-                    subprocess.run(["xdg-open", str(pkg_dir_absolute)], check=True)
-                logger.info("Successfully opened folder using platform-specific method")
-            except subprocess.CalledProcessError as e:
-                logger.error(f"Failed to open folder: {e}")
-        else:
-            logger.info("Successfully opened folder using QDesktopServices")
+        # Popen returns immediately, so a slow file manager never blocks the UI
+        command = FILE_MANAGER_COMMANDS.get(sys.platform, ["xdg-open"])
+        try:
+            subprocess.Popen(command + [str(pkg_dir_absolute)], start_new_session=True)
+        except OSError as e:
+            logger.error(f"Failed to open folder: {e}")
 
     def _on_refresh_checks_clicked(self):
         if not self.library_part:
@@ -210,42 +217,26 @@ class FootprintReviewPage(QWidget):
         self.refresh_button.setEnabled(False)
         self.refresh_button.setText("Refreshing...")
 
-        self.refresh_thread = QThread(self)
+        # Run on Qt's shared pool so repeated refreshes reuse warm threads;
+        # the reference keeps the worker's signal holder alive until it ends.
         self.refresh_worker = ElementUpdateWorker(
-            self.library_part, LibrePCBElement.PACKAGE
+            self.library_part,
+            LibrePCBElement.PACKAGE,
+            preview_target_size(self.librepcb_preview),
         )
-        self.refresh_worker.moveToThread(self.refresh_thread)
-
-        # Connections
-        self.refresh_worker.update_complete.connect(self._on_update_complete)
-        self.refresh_worker.update_failed.connect(self._on_update_failed)
-        self.refresh_thread.started.connect(self.refresh_worker.run)
-
-        # Cleanup: When the worker is done, it tells the thread to quit.
-        self.refresh_worker.finished.connect(self.refresh_thread.quit)
-        # When the thread is finished, schedule both for deletion.
-        self.refresh_thread.finished.connect(self.refresh_thread.deleteLater)
-        self.refresh_worker.finished.connect(self.refresh_worker.deleteLater)
-
-        self.refresh_thread.start()
+        self.refresh_worker.signals.update_complete.connect(self._on_update_complete)
+        self.refresh_worker.signals.update_failed.connect(self._on_update_failed)
+        QThreadPool.globalInstance().start(self.refresh_worker)
 
-    def _on_update_complete(self, png_path: str, issues: list):
+    def _on_update_complete(self, image: QImage, issues: list):
         logger.info("Footprint update complete. Refreshing UI.")
-        if png_path:
-            self.set_librepcb_footprint_image(QPixmap(png_path))
+        if not image.isNull():
+            self.set_librepcb_footprint_image(QPixmap.fromImage(image))
 
         # Reconcile and update the manifest
-        self.library_manager._update_element_manifest(
+        self.manifest = self.library_manager._update_element_manifest(
             LibrePCBElement.PACKAGE, self.library_part.footprint.uuid, issues
         )
-        # We need to re-load the manifest from disk to get the latest changes
-        manifest_path = LibrePCBElement.PACKAGE.get_wp_path(
-            self.library_part.footprint.uuid
-        )
-        if manifest_path.exists():
-            self.manifest = ElementManifest.model_validate_json(
-                manifest_path.read_text()
-            )
 
         # Reload messages into the UI
         self._load_validation_messages()
@@ -258,6 +249,14 @@ class FootprintReviewPage(QWidget):
         self.refresh_button.setEnabled(True)
         self.refresh_button.setText("Refresh Checks")
 
+    @Slot(int)
+    def _on_approval_checkbox_changed(self, state: int):
+        """
+        Shared slot for every row's checkbox; the row index is read back from
+        the checkbox's "msg_index" property.
+        """
+        self._on_approval_changed(state, self.sender().property("msg_index"))
+
     def _on_approval_changed(self, state: int, msg_index: int):
         """
         Handles the state change of an approval checkbox.
@@ -295,17 +294,17 @@ class FootprintReviewPage(QWidget):
         manifest_path = LibrePCBElement.PACKAGE.get_wp_path(
             self.library_part.footprint.uuid
         )
-        if manifest_path.exists():
-            try:
-                self.manifest = ElementManifest.model_validate_json(
-                    manifest_path.read_text()
-                )
-            except (json.JSONDecodeError, ValueError) as e:
-                logger.error(f"Failed to parse manifest {manifest_path}: {e}")
-                self.manifest = None
-        else:
+        try:
+            # Bytes go straight to pydantic's native JSON parser
+            self.manifest = ElementManifest.model_validate_json(
+                manifest_path.read_bytes()
+            )
+        except (FileNotFoundError, NotADirectoryError):
             logger.warning(f"Footprint manifest not found at {manifest_path}")
             self.manifest = None
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error(f"Failed to parse manifest {manifest_path}: {e}")
+            self.manifest = None
 
         self._load_validation_messages()
         self._update_button_state()
@@ -317,59 +316,110 @@ class FootprintReviewPage(QWidget):
         if not self.library_part or not self.footprint_message_list:
             return
 
+        self._message_items = []
+        self._widgeted_rows = set()
         self.footprint_message_list.clear()
 
         if not self.manifest:
             logger.warning("Cannot load messages: manifest not loaded.")
             return
 
-        for index, msg in enumerate(self.manifest.validation):
-            item = QTreeWidgetItem(self.footprint_message_list)
-            item.setData(0, Qt.UserRole, index)  # Store index on first column
-
-            # Column 1: Severity Icon (centered)
-            item.setText(1, self._get_icon_for_severity(msg.severity))
-            item.setTextAlignment(1, Qt.AlignCenter)
-
-            # Column 2: Message Text (left-aligned by default)
-            item.setText(2, msg.message)
-
-            # Column 0: Approved Checkbox (centered)
-            checkbox = QCheckBox()
-            checkbox.setChecked(msg.is_approved)
-
-            # Disable checkbox for read-only (LibrePCB) messages
-            is_readonly = msg.source == ValidationSource.LIBREPCB
-            if is_readonly:
-                checkbox.setEnabled(False)
-                item.setToolTip(
-                    2, "This check is from LibrePCB and cannot be approved here."
-                )
-            else:
-                checkbox.stateChanged.connect(
-                    lambda state, idx=index: self._on_approval_changed(state, idx)
-                )
-
-            # To center the checkbox, we place it inside a container widget with a centered layout
-            container = QWidget()
-            layout = QHBoxLayout(container)
-            layout.addWidget(checkbox)
-            layout.setAlignment(Qt.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            self.footprint_message_list.setItemWidget(item, 0, container)
-
-    def _get_icon_for_severity(self, severity: ValidationSeverity) -> str:
-        if severity == ValidationSeverity.WARNING:
-            return "⚠️"
-        if severity == ValidationSeverity.HINT:
-            return "💡"
-        if severity == ValidationSeverity.ERROR:
-            return "❌"
-        return ""
+        tree = self.footprint_message_list
+        # Build the rows detached and insert them in one call, so the tree does
+        # a single layout pass instead of one per message.
+        with batched_tree_updates(tree):
+            items = []
+            for index, msg in enumerate(self.manifest.validation):
+                item = QTreeWidgetItem()
+                item.setData(0, Qt.UserRole, index)  # Store index on first column
+
+                # Column 1: Severity Icon (centered)
+                item.setText(1, msg.severity.icon)
+                item.setTextAlignment(1, Qt.AlignCenter)
+
+                # Column 2: Message Text (left-aligned by default)
+                item.setText(2, msg.message)
+                if msg.source == ValidationSource.LIBREPCB:
+                    item.setToolTip(2, READONLY_MESSAGE_TOOLTIP)
+                items.append(item)
+            tree.addTopLevelItems(items)
+            self._message_items = items
+        # Checkbox widgets are attached lazily, starting with the visible rows
+        self._ensure_widgets_for_visible()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Rows only get a viewport position once the tree has been laid out
+        QTimer.singleShot(0, self._ensure_widgets_for_visible)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._ensure_widgets_for_visible()
+
+    def _ensure_widgets_for_visible(self, *_):
+        """
+        Attaches checkbox widgets to the rows inside the viewport and drops them
+        from rows that have scrolled out, so widget count tracks the view size
+        rather than the number of messages.
+        """
+        tree = self.footprint_message_list
+        if not tree or not self._message_items:
+            return
+
+        first = tree.itemAt(QPoint(0, 0)) if tree.isVisible() else None
+        if first is None:
+            # Not laid out yet (e.g. the page is hidden); the show and resize
+            # hooks call back once rows have a place in the viewport
+            visible = set()
+        else:
+            last = tree.itemAt(QPoint(0, tree.viewport().height() - 1))
+            start = tree.indexOfTopLevelItem(first)
+            end = (
+                tree.indexOfTopLevelItem(last) if last else tree.topLevelItemCount() - 1
+            )
+            visible = {
+                tree.topLevelItem(row).data(0, Qt.UserRole)
+                for row in range(start, end + 1)
+            }
+
+        for index in self._widgeted_rows - visible:
+            tree.removeItemWidget(self._message_items[index], 0)
+        for index in visible - self._widgeted_rows:
+            tree.setItemWidget(
+                self._message_items[index], 0, self._create_approval_widget(index)
+            )
+        self._widgeted_rows = visible
+
+    def _create_approval_widget(self, index: int) -> QWidget:
+        """Builds the centered approval checkbox container for one message row."""
+        msg = self.manifest.validation[index]
+        # Column 0: Approved Checkbox (centered)
+        checkbox = QCheckBox()
+        checkbox.setChecked(msg.is_approved)
+
+        # Disable checkbox for read-only (LibrePCB) messages
+        if msg.source == ValidationSource.LIBREPCB:
+            checkbox.setEnabled(False)
+        else:
+            checkbox.setProperty("msg_index", index)
+            checkbox.stateChanged.connect(self._on_approval_checkbox_changed)
+
+        # To center the checkbox, we place it inside a container widget with a centered layout
+        container = QWidget()
+        layout = QHBoxLayout(container)
+        layout.addWidget(checkbox)
+        layout.setAlignment(Qt.AlignCenter)
+        layout.setContentsMargins(0, 0, 0, 0)
+        return container
+
+    def _find_widget(self, widget_type, name: str):
+        """Returns the named widget from the loaded UI if it has the given type."""
+        widget = self._ui_widgets.get(name)
+        return widget if isinstance(widget, widget_type) else None
 
     def _setup_easyeda_preview(self):
         """Configures the left-side image viewer for the EasyEDA footprint."""
-        placeholder_view = self.ui.findChild(QGraphicsView, "footprint_image_container")
+        placeholder_view = self._find_widget(QGraphicsView, "footprint_image_container")
         if not placeholder_view:
             logger.error("Could not find 'footprint_image_container' in the UI.")
             return
@@ -387,11 +437,33 @@ class FootprintReviewPage(QWidget):
         Sets the EasyEDA footprint image in the left-side container.
         """
         if hasattr(self, "footprint_image_view"):
+            key = pixmap.cacheKey()
+            if key == self._last_easyeda_key:
+                return
+            self._last_easyeda_key = key
             self.footprint_image_view.show_pixmap(pixmap)
 
+    def show_images_loading(self):
+        """
+        Shows a loading placeholder in both footprint views until their
+        images are set.
+        """
+        self._last_easyeda_key = None
+        self._last_librepcb_key = None
+        for view in (
+            getattr(self, "footprint_image_view", None),
+            getattr(self, "librepcb_preview", None),
+        ):
+            if view:
+                view.show_text(UIText.LOADING.value)
+
     def set_librepcb_footprint_image(self, pixmap: QPixmap):
         """
         Sets the generated LibrePCB footprint image in the right-side container.
         """
         if hasattr(self, "librepcb_preview"):
+            key = pixmap.cacheKey()
+            if key == self._last_librepcb_key:
+                return
+            self._last_librepcb_key = key
             self.librepcb_preview.show_pixmap(pixmap)
@@ -1,4 +1,10 @@
 import logging
+from typing import Optional
+
+from PySide6.QtCore import QSize
+
+from constants import PREVIEW_ZOOM_HEADROOM
+
 from .zoom_pan_image_text_widget import ZoomPanImageAndTextWidget
 
 logger = logging.getLogger(__name__)
@@ -9,3 +15,10 @@ class LibraryElementImageWidget(ZoomPanImageAndTextWidget):
         # Library elements should just fit the view without extra zoom.
         super().__init__(parent, zoom_factor=1.0)
         logger.debug("LibraryElementImageWidget created.")
+
+
+def preview_target_size(preview: Optional[LibraryElementImageWidget]) -> QSize:
+    """Size a render for preview is pre-scaled to, leaving headroom to zoom."""
+    if not preview:
+        return QSize()
+    return preview.size() * (preview.devicePixelRatioF() * PREVIEW_ZOOM_HEADROOM)
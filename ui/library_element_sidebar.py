@@ -1,23 +1,20 @@
-import os
 import logging
-from PySide6.QtCore import QObject, Qt, Signal, QTimer
-from PySide6.QtGui import QPixmap, QFont
-from PySide6.QtUiTools import QUiLoader
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QFrame,
     QGraphicsView,
-    QGraphicsScene,
-    QGraphicsPixmapItem,
-    QGraphicsTextItem,
     QPushButton,
 )
 
 from models.library_part import LibraryPart
 from models.elements import LibrePCBElement
-from constants import UIText, WebPartsFilename
+from constants import WebPartsFilename
+from .hero_image_widget import HeroImageWidget
 from .part_info_widget import PartInfoWidget
+from .pixmap_cache import cached_pixmap
+from .ui_loader import load_ui
 
 logger = logging.getLogger(__name__)
 
@@ -28,14 +25,8 @@ class LibraryElementSidebar(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        loader = QUiLoader()
-        loader.registerCustomWidget(PartInfoWidget)
-        ui_file_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "page_library_element.ui"
-        )
-
         # Load the full UI to extract the contextFrame
-        full_ui = loader.load(ui_file_path, None)
+        full_ui = load_ui("page_library_element.ui", None, (PartInfoWidget,))
         self.context_frame = full_ui.findChild(QFrame, "contextFrame")
 
         if self.context_frame:
@@ -65,17 +56,18 @@ class LibraryElementSidebar(QWidget):
             logger.error("Could not find 'contextFrame' in the UI file.")
 
     def _setup_hero_image(self):
-        self.hero_scene = QGraphicsScene()
-        self.hero_view.setScene(self.hero_scene)
-        self.hero_pixmap_item = QGraphicsPixmapItem()
-        self.hero_scene.addItem(self.hero_pixmap_item)
-        self.hero_text_item = QGraphicsTextItem()
-        font = QFont()
-        font.setPointSize(12)
-        self.hero_text_item.setFont(font)
-        self.hero_text_item.setDefaultTextColor(Qt.gray)
-        self.hero_scene.addItem(self.hero_text_item)
-        self._set_hero_text(UIText.NO_IMAGE.value)
+        """Swaps the UI's plain hero view for the shared HeroImageWidget."""
+        self.hero_image_widget = HeroImageWidget(self.context_frame)
+        parent_layout = (
+            self.hero_view.parentWidget().layout() if self.hero_view else None
+        )
+        if parent_layout:
+            parent_layout.replaceWidget(self.hero_view, self.hero_image_widget)
+            self.hero_view.deleteLater()
+            self.hero_view = None
+        else:
+            logger.error("Could not find 'image_hero_view' layout for hero image.")
+        self.hero_image_widget.show_no_image()
 
     def set_component(self, part: LibraryPart):
         if self.part_info_widget:
@@ -87,28 +79,8 @@ class LibraryElementSidebar(QWidget):
             / part.uuid
             / WebPartsFilename.HERO_IMAGE.value
         )
-        if hero_path.exists():
-            pixmap = QPixmap(str(hero_path))
-            self._set_hero_pixmap(pixmap)
-        else:
-            self._set_hero_text(UIText.IMAGE_NOT_AVAILABLE.value)
-
-    def _set_hero_text(self, text: str):
-        self.hero_text_item.setPlainText(text)
-        self.hero_text_item.setVisible(True)
-        self.hero_pixmap_item.setVisible(False)
-        self.hero_view.centerOn(self.hero_text_item)
-
-    def _set_hero_pixmap(self, pixmap: QPixmap):
+        pixmap = cached_pixmap(hero_path)
         if not pixmap.isNull():
-            self.hero_pixmap_item.setPixmap(pixmap)
-            self.hero_pixmap_item.setVisible(True)
-            self.hero_text_item.setVisible(False)
-            QTimer.singleShot(
-                0,
-                lambda: self.hero_view.fitInView(
-                    self.hero_pixmap_item, Qt.KeepAspectRatio
-                ),
-            )
+            self.hero_image_widget.show_pixmap(pixmap)
         else:
-            self._set_hero_text(UIText.IMAGE_NOT_AVAILABLE.value)
+            self.hero_image_widget.show_image_not_available()
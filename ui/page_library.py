@@ -1,9 +1,10 @@
 import os
 import logging
-from typing import List
+from collections import OrderedDict
+from typing import List, Optional
 
-from PySide6.QtCore import Qt, QThread, Signal, QObject
-from PySide6.QtGui import QPixmap, QFont
+from PySide6.QtCore import Qt, QThread, QTimer, Signal, QObject
+from PySide6.QtGui import QImage, QPixmap, QFont
 from PySide6.QtWidgets import (
     QWidget,
     QTreeWidget,
@@ -13,18 +14,35 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHeaderView,
 )
-from PySide6.QtUiTools import QUiLoader
 
 from library_manager import LibraryManager
 from models.library_part import LibraryPart
-from models.status import StatusValue
+from .custom_widgets import batched_tree_updates
 from .part_info_widget import PartInfoWidget
 from .hero_image_widget import HeroImageWidget
-from models.elements import LibrePCBElement
-from constants import WebPartsFilename, UIText
+from .pixmap_cache import read_scaled_image
+from .ui_loader import load_ui
+from constants import (
+    HERO_IMAGE_CACHE_SIZE,
+    HERO_PREFETCH_COUNT,
+    HERO_PREVIEW_MAX_SIDE,
+    WEBPARTS_DIR,
+    WebPartsFilename,
+    UIText,
+)
 
 logger = logging.getLogger(__name__)
 
+# First of the four status columns (footprint, symbol, component, device)
+FIRST_STATUS_COLUMN = 4
+
+# Number of parts the loader sends to the tree per signal
+LOAD_CHUNK_SIZE = 200
+
+# Quiet period after a selection change before the part is read from disk, so
+# arrow-keying through rows only hydrates the row the user stops on
+SELECTION_DEBOUNCE_MS = 80
+
 
 class LibraryTreeWidget(QTreeWidget):
     """Custom QTreeWidget that can detect clicks in empty areas"""
@@ -32,12 +50,23 @@ class LibraryTreeWidget(QTreeWidget):
     clicked_empty_area = Signal()
 
     def mousePressEvent(self, event):
-        item = self.itemAt(event.position().toPoint())
-        if item is None:
+        # Let the normal item click through first; only empty-area clicks
+        # need the extra deselect work.
+        super().mousePressEvent(event)
+        if self.itemAt(event.position().toPoint()) is None:
             self.clearSelection()
             self.setCurrentItem(None)
             self.clicked_empty_area.emit()
-        super().mousePressEvent(event)
+
+
+def status_icons(status) -> tuple:
+    """Icons for the tree's status columns, read by direct attribute access."""
+    return (
+        status.footprint.icon,
+        status.symbol.icon,
+        status.component.icon,
+        status.device.icon,
+    )
 
 
 class LibraryPartLite:
@@ -49,7 +78,7 @@ class LibraryPartLite:
         "part_name",
         "lcsc_id",
         "description",
-        "status_flags",
+        "status_icons",
         "hero_path",
     )
 
@@ -60,7 +89,7 @@ class LibraryPartLite:
         part_name: str,
         lcsc_id: str,
         description: str,
-        status_flags: dict,
+        status_icons: tuple,
         hero_path: str,
     ):
         self.uuid = uuid
@@ -68,34 +97,28 @@ class LibraryPartLite:
         self.part_name = part_name
         self.lcsc_id = lcsc_id
         self.description = description
-        self.status_flags = status_flags
+        self.status_icons = status_icons
         self.hero_path = hero_path
 
 
 class LibraryLoaderWorker(QObject):
-    parts_loaded = Signal(list)
+    parts_chunk = Signal(list)
+    load_finished = Signal()
     load_failed = Signal(str)
 
-    def __init__(self):
+    def __init__(self, manager: LibraryManager):
         super().__init__()
-        self.manager = LibraryManager()
+        self.manager = manager
+        # Hero paths are joined as plain strings, once per part
+        self._hero_prefix = str(WEBPARTS_DIR) + os.sep
+        self._hero_suffix = os.sep + WebPartsFilename.HERO_IMAGE.value
 
     def load_parts(self):
         try:
             parts_lite = []
-            for part in self.manager.get_all_parts():
-                flags = {
-                    "footprint": part.status.footprint.value,
-                    "symbol": part.status.symbol.value,
-                    "component": part.status.component.value,
-                    "device": part.status.device.value,
-                }
-                hero = (
-                    LibrePCBElement.PACKAGE.dir.parent
-                    / "webparts"
-                    / part.uuid
-                    / WebPartsFilename.HERO_IMAGE.value
-                )
+            for part in self.manager.iter_parts():
+                # Rendered here once so the GUI thread only copies strings
+                icons = status_icons(part.status)
                 parts_lite.append(
                     LibraryPartLite(
                         part.uuid,
@@ -103,59 +126,114 @@ class LibraryLoaderWorker(QObject):
                         part.part_name,
                         part.lcsc_id,
                         part.description,
-                        flags,
-                        str(hero),
+                        icons,
+                        self._hero_prefix + part.uuid + self._hero_suffix,
                     )
                 )
-            self.parts_loaded.emit(parts_lite)
+                # Hand rows over in chunks so the GUI can paint between them
+                if len(parts_lite) >= LOAD_CHUNK_SIZE:
+                    self.parts_chunk.emit(parts_lite)
+                    parts_lite = []
+            if parts_lite:
+                self.parts_chunk.emit(parts_lite)
         except Exception as e:
             logger.error("Library loading failed", exc_info=True)
             self.load_failed.emit(str(e))
+        finally:
+            self.load_finished.emit()
 
 
 class PartHydratorWorker(QObject):
     hydration_ready = Signal(
         object, str
     )  # (part, uuid) to identify which row to update
+    hero_image_ready = Signal(str, object)  # (uuid, hero image or None)
     hydration_failed = Signal(str)
 
-    def __init__(self):
+    def __init__(self, manager: LibraryManager):
         super().__init__()
-        self.manager = LibraryManager()
-
-    def hydrate(self, lite: LibraryPartLite):
+        self.manager = manager
+        # Token of the newest request; written directly by the GUI thread so
+        # queued requests it has already superseded can be dropped.
+        self.latest_token = 0
+        # hero path -> (mtime_ns, QImage), oldest first; only touched here
+        self._hero_cache = OrderedDict()
+
+    def hydrate(self, lite: LibraryPartLite, token: int):
+        if token != self.latest_token:
+            return
         try:
-            all_parts = self.manager.get_all_parts()
-            part = next((p for p in all_parts if p.uuid == lite.uuid), None)
+            part = self.manager.get_part_by_uuid(lite.uuid)
             if not part:
                 raise FileNotFoundError(f"Part manifest not found: {lite.uuid}")
-
-            pixmap = QPixmap()
-            if lite.hero_path and os.path.exists(lite.hero_path):
-                pixmap.load(lite.hero_path)
-            part._hero_pixmap = pixmap
+            if token != self.latest_token:
+                return
 
             # Emit both the part data AND the UUID to identify which tree row to update
             self.hydration_ready.emit(part, lite.uuid)
+
+            # The sidebar text is already on its way; the image decode follows
+            # unless the user has moved on to another part meanwhile.
+            if token != self.latest_token:
+                return
+            # Decoded here at preview size; QPixmap is made on the GUI thread
+            hero_image = self._load_hero_image(lite.hero_path)
+            self.hero_image_ready.emit(lite.uuid, hero_image)
         except Exception as e:
             logger.error(
                 f"❌ Part hydration failed for {lite.uuid}: {e}", exc_info=True
             )
             self.hydration_failed.emit(str(e))
 
+    def prefetch_heroes(self, paths: List[str], token: int):
+        """
+        Decodes heroes into the cache ahead of a click. Stops as soon as a
+        selection bumps the token, so a real request waits on one decode at
+        most.
+        """
+        for path in paths:
+            if token != self.latest_token:
+                return
+            self._load_hero_image(path)
+
+    def _load_hero_image(self, path: str) -> Optional[QImage]:
+        """
+        Returns the preview-size hero image, or None if there is none. The
+        decode is reused while the file's mtime is unchanged.
+        """
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            self._hero_cache.pop(path, None)
+            return None
+
+        cached = self._hero_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            self._hero_cache.move_to_end(path)
+            return cached[1]
+
+        image = read_scaled_image(path, HERO_PREVIEW_MAX_SIDE)
+        if image.isNull():
+            self._hero_cache.pop(path, None)
+            return None
+        self._hero_cache[path] = (mtime_ns, image)
+        self._hero_cache.move_to_end(path)
+        if len(self._hero_cache) > HERO_IMAGE_CACHE_SIZE:
+            self._hero_cache.popitem(last=False)
+        return image
+
 
 class LibraryPage(QWidget):
     go_to_search_requested = Signal()
     edit_part_requested = Signal(object)
+    hydration_requested = Signal(object, int)  # (lite, token)
+    prefetch_requested = Signal(list, int)  # (hero paths, token)
+    load_requested = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        loader = QUiLoader()
-        loader.registerCustomWidget(PartInfoWidget)
-        loader.registerCustomWidget(HeroImageWidget)
-        ui_file = os.path.join(os.path.dirname(__file__), "page_library.ui")
-        ui = loader.load(ui_file, self)
+        ui = load_ui("page_library.ui", self, (PartInfoWidget, HeroImageWidget))
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -177,6 +255,9 @@ class LibraryPage(QWidget):
         self.part_info_widget: PartInfoWidget = ui.findChild(
             PartInfoWidget, "part_info_widget"
         )
+        if self.part_info_widget:
+            # Forget the widget once Qt deletes it instead of guarding every call
+            self.part_info_widget.destroyed.connect(self._on_part_info_widget_destroyed)
         self.label_3dModelStatus = ui.findChild(QLabel, "label_3dModelStatus")
         self.datasheetLink = ui.findChild(QLabel, "datasheetLink")
 
@@ -196,6 +277,11 @@ class LibraryPage(QWidget):
                 ]
             )
             custom_tree.setColumnCount(8)
+            # Flat list of single-line rows: the view can lay rows out from one
+            # height instead of measuring each, and needs no expand handling
+            custom_tree.setUniformRowHeights(True)
+            custom_tree.setRootIsDecorated(False)
+            custom_tree.setItemsExpandable(False)
             header = custom_tree.header()
             header.setStretchLastSection(True)
             header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
@@ -212,24 +298,58 @@ class LibraryPage(QWidget):
             self.tree.deleteLater()
             self.tree = custom_tree
 
+        # The manager keeps no per-instance state, so both workers share one
+        self.manager = LibraryManager()
+
         self.loader_thread = QThread()
-        self.loader_worker = LibraryLoaderWorker()
+        self.loader_thread.setObjectName("LibraryLoader")
+        self.loader_worker = LibraryLoaderWorker(self.manager)
         self.loader_worker.moveToThread(self.loader_thread)
-        self.loader_worker.parts_loaded.connect(self.on_parts_loaded)
+        self.loader_worker.parts_chunk.connect(self.on_parts_chunk, Qt.QueuedConnection)
+        self.loader_worker.load_finished.connect(
+            self.on_load_finished, Qt.QueuedConnection
+        )
         self.loader_worker.load_failed.connect(
             lambda err: logger.error(f"Load failed: {err}")
         )
-        self.loader_thread.started.connect(self.loader_worker.load_parts)
+        # The loader thread stays up for the page's lifetime; each refresh is
+        # one queued request to it rather than a thread restart.
+        self.load_requested.connect(self.loader_worker.load_parts, Qt.QueuedConnection)
+        self._loading = False
+        # uuid -> row, filled as chunks arrive, for hydration row updates
+        self._uuid_to_item = {}
+        self.loader_thread.start()
 
         self.hydrator_thread = QThread()
-        self.hydrator_worker = PartHydratorWorker()
+        self.hydrator_thread.setObjectName("PartHydrator")
+        self.hydrator_worker = PartHydratorWorker(self.manager)
         self.hydrator_worker.moveToThread(self.hydrator_thread)
-        self.hydrator_worker.hydration_ready.connect(self.on_hydration_ready)
+        # Both directions are queued: requests run on the hydrator thread and
+        # results come back to the GUI thread.
+        self.hydrator_worker.hydration_ready.connect(
+            self.on_hydration_ready, Qt.QueuedConnection
+        )
+        self.hydrator_worker.hero_image_ready.connect(
+            self.on_hero_image_ready, Qt.QueuedConnection
+        )
         self.hydrator_worker.hydration_failed.connect(
             lambda err: logger.error(f"Hydration failed: {err}")
         )
+        self.hydration_requested.connect(
+            self.hydrator_worker.hydrate, Qt.QueuedConnection
+        )
+        self.prefetch_requested.connect(
+            self.hydrator_worker.prefetch_heroes, Qt.QueuedConnection
+        )
+        self._hydrate_token = 0
         self.hydrator_thread.start()
 
+        self._pending_hydration = None
+        self._selection_debounce = QTimer(self)
+        self._selection_debounce.setSingleShot(True)
+        self._selection_debounce.setInterval(SELECTION_DEBOUNCE_MS)
+        self._selection_debounce.timeout.connect(self._request_hydration)
+
         if self.search_button:
             self.search_button.clicked.connect(self.go_to_search_requested)
         if self.edit_part_button:
@@ -247,30 +367,65 @@ class LibraryPage(QWidget):
         self.refresh_library()
 
     def refresh_library(self):
-        if not self.loader_thread.isRunning():
-            self.loader_thread.start()
+        if self._loading:
+            return
+        self._loading = True
+        # Rows arrive in chunks from the loader, so start from an empty tree
+        self.tree.clear()
+        self._uuid_to_item.clear()
+        self.load_requested.emit()
+
+    def on_load_finished(self):
+        self._loading = False
+        self._prefetch_visible_heroes()
+
+    def _prefetch_visible_heroes(self):
+        """Asks the hydrator to decode the heroes of the top visible rows."""
+        if not self.tree or self.tree.currentItem() is not None:
+            # A selection is already being hydrated; don't queue ahead of it
+            return
+        item = self.tree.itemAt(0, 0) or self.tree.topLevelItem(0)
+        paths = []
+        while item is not None and len(paths) < HERO_PREFETCH_COUNT:
+            paths.append(item.data(0, Qt.UserRole).hero_path)
+            item = self.tree.itemBelow(item)
+        if paths:
+            self.prefetch_requested.emit(paths, self._hydrate_token)
 
     def clear_selection(self):
+        self._selection_debounce.stop()
+        self._pending_hydration = None
+        self.last_hydration_request_uuid = None
         self.current_selected_part = None
         if self.tree:
             self.tree.clearSelection()
             self.tree.setCurrentItem(None)
+        self._reset_detail_panels(loading=False)
+
+    def _reset_detail_panels(self, loading: bool):
+        """Resets the sidebar either to its loading state or to empty."""
         if self.hero_image_widget:
-            self.hero_image_widget.clear()
+            if loading:
+                self.hero_image_widget.show_loading()
+            else:
+                self.hero_image_widget.clear()
         if self.part_info_widget:
-            try:
-                self.part_info_widget.clear()
-            except RuntimeError:
-                logger.warning("PartInfoWidget already deleted, skipping clear()")
+            self.part_info_widget.clear()
         if self.label_3dModelStatus:
-            self.label_3dModelStatus.setText("3D Model: (Not found)")
+            self.label_3dModelStatus.setText(
+                UIText.LOADING.value if loading else "3D Model: (Not found)"
+            )
         if self.datasheetLink:
-            self.datasheetLink.setText('Datasheet: <a href="#">(Not available)</a>')
+            detail = UIText.LOADING.value if loading else "Not available"
+            self.datasheetLink.setText(f'Datasheet: <a href="#">({detail})</a>')
         if self.edit_part_button:
-            self.edit_part_button.setEnabled(False)
+            self.edit_part_button.setEnabled(loading)
 
-    def on_parts_loaded(self, parts_lite: List[LibraryPartLite]):
-        self.tree.clear()
+    def _on_part_info_widget_destroyed(self):
+        self.part_info_widget = None
+
+    def on_parts_chunk(self, parts_lite: List[LibraryPartLite]):
+        items = []
         for lite in parts_lite:
             item = QTreeWidgetItem(
                 [
@@ -278,60 +433,49 @@ class LibraryPage(QWidget):
                     lite.part_name,
                     lite.lcsc_id,
                     lite.description,
-                    "",
-                    "",
-                    "",
-                    "",
+                    *lite.status_icons,
                 ]
             )
             item.setData(0, Qt.UserRole, lite)
-            for col, key in enumerate(
-                ["footprint", "symbol", "component", "device"], start=4
-            ):
-                status_value = lite.status_flags.get(key)
-                if status_value == "approved":
-                    icon = StatusValue.APPROVED.icon
-                elif status_value == "unavailable":
-                    icon = StatusValue.UNAVAILABLE.icon
-                elif status_value == "needs_review":
-                    icon = StatusValue.NEEDS_REVIEW.icon
-                else:
-                    icon = StatusValue.ERROR.icon
+            items.append(item)
+            self._uuid_to_item[lite.uuid] = item
 
-                item.setText(col, icon)
-            self.tree.addTopLevelItem(item)
-        self.loader_thread.quit()
+        # Insert every row in one call with repaints, sorting and the tree's
+        # own signals suspended; new rows never change the selection
+        with batched_tree_updates(self.tree):
+            self.tree.addTopLevelItems(items)
 
     def on_tree_selection_changed(
         self, current: QTreeWidgetItem, previous: QTreeWidgetItem
     ):
         if current:
             lite: LibraryPartLite = current.data(0, Qt.UserRole)
+            if lite.uuid == self.last_hydration_request_uuid:
+                # Same part as the shown or in-flight one; nothing to re-read
+                return
             logger.debug(f"🖱️ Selected {lite.lcsc_id} - triggering fresh disk read")
 
             # Track the latest request
             self.last_hydration_request_uuid = lite.uuid
 
-            if self.hero_image_widget:
-                self.hero_image_widget.show_loading()
-            if self.part_info_widget:
-                try:
-                    self.part_info_widget.clear()
-                except RuntimeError:
-                    logger.warning("PartInfoWidget already deleted, skipping clear()")
-            if self.label_3dModelStatus:
-                self.label_3dModelStatus.setText(UIText.LOADING.value)
-            if self.datasheetLink:
-                self.datasheetLink.setText(
-                    f'Datasheet: <a href="#">({UIText.LOADING.value})</a>'
-                )
-            if self.edit_part_button:
-                self.edit_part_button.setEnabled(True)
-            self.hydrator_worker.hydrate(lite)
+            self._reset_detail_panels(loading=True)
+            # Bump the token now so requests already queued for earlier rows
+            # are dropped; the new one is sent once the selection settles.
+            self._hydrate_token += 1
+            self.hydrator_worker.latest_token = self._hydrate_token
+            self._pending_hydration = lite
+            self._selection_debounce.start()
         else:
             logger.debug(f"🔄 Deselected row - clearing sidebar")
             self.clear_selection()
 
+    def _request_hydration(self):
+        lite, self._pending_hydration = self._pending_hydration, None
+        if lite is not None:
+            # Runs on the hydrator thread; a newer selection bumps the token
+            # and makes it return before reading anything from disk.
+            self.hydration_requested.emit(lite, self._hydrate_token)
+
     def on_hydration_ready(self, part, hydrated_uuid: str):
         """Handle hydration completion and update the specific tree row by UUID."""
         logger.debug(
@@ -344,17 +488,6 @@ class LibraryPage(QWidget):
                 f"✅ Hydration matches last request. Updating sidebar for {part.lcsc_id}"
             )
             self.current_selected_part = part
-            if self.hero_image_widget:
-                hero_path = (
-                    LibrePCBElement.PACKAGE.dir.parent
-                    / "webparts"
-                    / part.uuid
-                    / WebPartsFilename.HERO_IMAGE.value
-                )
-                if hero_path.exists():
-                    self.hero_image_widget.show_pixmap(QPixmap(str(hero_path)))
-                else:
-                    self.hero_image_widget.show_no_image()
             if self.part_info_widget:
                 self.part_info_widget.set_component(part)
             if self.label_3dModelStatus:
@@ -381,22 +514,28 @@ class LibraryPage(QWidget):
             logger.debug(
                 f"🔄 Updating tree icons for {part.lcsc_id} after fresh disk read"
             )
-            for col, key in enumerate(
-                ["footprint", "symbol", "component", "device"], start=4
+            for col, icon in enumerate(
+                status_icons(part.status), start=FIRST_STATUS_COLUMN
             ):
-                val = getattr(part.status, key)
-                target_item.setText(col, val.icon)
+                # Usually unchanged; skip the dataChanged/repaint in that case
+                if target_item.text(col) != icon:
+                    target_item.setText(col, icon)
         else:
             logger.warning(f"❌ Could not find tree item for UUID {hydrated_uuid}")
 
+    def on_hero_image_ready(self, hydrated_uuid: str, hero_image):
+        """Shows the hero decoded after the part's metadata, if still selected."""
+        if self.last_hydration_request_uuid != hydrated_uuid:
+            return
+        if self.hero_image_widget:
+            if hero_image is not None:
+                self.hero_image_widget.show_pixmap(QPixmap.fromImage(hero_image))
+            else:
+                self.hero_image_widget.show_no_image()
+
     def _find_tree_item_by_uuid(self, target_uuid: str) -> QTreeWidgetItem:
         """Find a tree item by its associated LibraryPartLite UUID."""
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            lite = item.data(0, Qt.UserRole)
-            if lite and lite.uuid == target_uuid:
-                return item
-        return None
+        return self._uuid_to_item.get(target_uuid)
 
     def on_empty_area_clicked(self):
         self.clear_selection()
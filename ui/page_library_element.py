@@ -1,82 +1,79 @@
-import os
 import logging
 from functools import partial
+from typing import Optional, Union
 
-from PySide6.QtCore import QObject, Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QPixmap, QFont
-from PySide6.QtUiTools import QUiLoader
+from PySide6.QtCore import Qt, QThreadPool, Signal, QTimer
+from PySide6.QtGui import QFont, QImage, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QWidget,
-    QVBoxLayout,
     QHBoxLayout,
     QFrame,
     QGraphicsView,
     QGraphicsScene,
+    QGraphicsItem,
     QGraphicsPixmapItem,
     QGraphicsTextItem,
-    QLabel,
     QStackedWidget,
     QPushButton,
     QSplitter,
 )
 
-from models.library_part import LibraryPart
 from models.status import StatusValue
-from models.elements import LibrePCBElement
 from adapters.search_engine import Vendor
-from search import Search
+from search import get_shared_search
 from library_manager import LibraryManager
 from .footprint_review_page import FootprintReviewPage
+from .library_element_image_widget import preview_target_size
 from .symbol_review_page import SymbolReviewPage
 from .component_review_page import ComponentReviewPage
 from .part_info_widget import PartInfoWidget
-from .custom_widgets import ClickableLabel, ZoomPanGraphicsView
-from constants import UIText, WebPartsFilename, WORKFLOW_MAPPING
+from .custom_widgets import ClickableLabel, ZoomPanGraphicsView, batched_view_updates
+from .pixmap_cache import cache_pixmap_from_image, image_cache_key
+from .ui_loader import load_ui, named_children
+from .ui_workers import ImageFileWorker, ImageWorker, get_shared_download_pool
+from constants import (
+    HERO_PREVIEW_MAX_SIDE,
+    UIText,
+    WORKFLOW_MAPPING,
+)
 
 logger = logging.getLogger(__name__)
 
+# Review pages in the .ui's stack, by placeholder name
+REVIEW_PAGE_CLASSES = {
+    "page_FootprintReview": FootprintReviewPage,
+    "page_SymbolReview": SymbolReviewPage,
+    "page_ComponentReview": ComponentReviewPage,
+}
 
-class ImageWorker(QObject):
-    image_loaded = Signal(bytes, str)
-    image_failed = Signal(str, str)
+# Parts set within this window of each other are coalesced into the last one
+SET_COMPONENT_DEBOUNCE_MS = 80
 
-    def __init__(self, api_service):
-        super().__init__()
-        self.api_service = api_service
+# Review previews are decoded to their view's zoom target rounded up to a
+# power of two, and never below this, so a page that has not been laid out
+# yet still gets a usable image and small resizes reuse the cached decode
+PREVIEW_DECODE_MIN_SIDE = 1024
 
-    def load_image(self, vendor: str, image_url: str, image_type: str):
-        try:
-            result = self.api_service.download_image_from_url(vendor, image_url)
-            if result:
-                image_data, cache_path = result
-                self.image_loaded.emit(image_data, image_type)
-            else:
-                self.image_failed.emit("Failed to download image", image_type)
-        except Exception as e:
-            logger.error(f"ImageWorker failed: {e}", exc_info=True)
-            self.image_failed.emit(str(e), image_type)
+
+def _preview_decode_side(page) -> int:
+    target = preview_target_size(page.librepcb_preview)
+    side = PREVIEW_DECODE_MIN_SIDE
+    while side < max(target.width(), target.height()):
+        side *= 2
+    return side
 
 
 class LibraryElementPage(QWidget):
-    request_image = Signal(Vendor, str, str)
     back_to_library_requested = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.library_manager = LibraryManager()
 
-        loader = QUiLoader()
-        loader.registerCustomWidget(ClickableLabel)
-        loader.registerCustomWidget(PartInfoWidget)
-        loader.registerCustomWidget(FootprintReviewPage)
-        loader.registerCustomWidget(SymbolReviewPage)
-        loader.registerCustomWidget(ComponentReviewPage)
-        ui_file_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "page_library_element.ui"
-        )
-
         # Load the UI file but don't parent it to self yet
-        self.ui_content = loader.load(ui_file_path, None)
+        self.ui_content = load_ui(
+            "page_library_element.ui", None, (ClickableLabel, PartInfoWidget)
+        )
 
         self._find_widgets()
 
@@ -96,8 +93,26 @@ class LibraryElementPage(QWidget):
         # Set initial splitter sizes programmatically to a 1:4 ratio
         self.main_splitter.setSizes([200, 800])
 
-        self.api_service = Search()
-        self._setup_workers()
+        self.api_service = get_shared_search()
+        # Bumped per component so image results for a part no longer shown
+        # are dropped
+        self._image_request_id = 0
+        self._image_jobs = {}
+        # URL of the hero download the page is currently waiting for
+        self._hero_url = None
+        # Set when a hero image arrived while the view was hidden; showEvent
+        # fits it once the view has its real size
+        self._hero_fit_pending = False
+        # image type -> (QPixmapCache key, setter) for previews being decoded
+        self._pending_images = {}
+        # stack index -> fills that review page for the current component
+        self._pending_steps = {}
+        # Part waiting for the debounce window to close; see set_component
+        self._pending_component = None
+        self._set_component_timer = QTimer(self)
+        self._set_component_timer.setSingleShot(True)
+        self._set_component_timer.setInterval(SET_COMPONENT_DEBOUNCE_MS)
+        self._set_component_timer.timeout.connect(self._apply_pending_component)
         self._connect_signals()
 
     def _find_widgets(self):
@@ -106,14 +121,13 @@ class LibraryElementPage(QWidget):
         self.review_stack = self.ui_content.findChild(
             QStackedWidget, "reviewStackedWidget"
         )
-        self.part_info_widget = self.context_frame.findChild(
-            PartInfoWidget, "part_info_widget"
-        )
+        # One walk per subtree instead of a findChild() walk per widget
+        context = named_children(self.context_frame)
+        pages = named_children(self.review_stack)
+        self.part_info_widget: PartInfoWidget = context.get("part_info_widget")
 
         # Replace hero image placeholder with ZoomPanGraphicsView
-        hero_view_placeholder = self.context_frame.findChild(
-            QGraphicsView, "image_hero_view"
-        )
+        hero_view_placeholder = context.get("image_hero_view")
         if hero_view_placeholder:
             self.hero_scene = QGraphicsScene(self)
             self.hero_view = ZoomPanGraphicsView(self.hero_scene, self)
@@ -128,24 +142,31 @@ class LibraryElementPage(QWidget):
             logger.error("Could not find 'image_hero_view' placeholder in UI.")
             self.hero_view = QGraphicsView()  # Dummy widget
 
-        self.back_to_library_button = self.context_frame.findChild(
-            QPushButton, "back_to_library_button"
-        )
-        self.button_PreviousStep = self.context_frame.findChild(
-            QPushButton, "button_PreviousStep"
-        )
-        self.button_NextStep = self.context_frame.findChild(
-            QPushButton, "button_NextStep"
-        )
-        self.page_FootprintReview: FootprintReviewPage = self.review_stack.findChild(
-            QWidget, "page_FootprintReview"
-        )
-        self.page_SymbolReview: SymbolReviewPage = self.review_stack.findChild(
-            QWidget, "page_SymbolReview"
-        )
-        self.page_ComponentReview: ComponentReviewPage = self.review_stack.findChild(
-            QWidget, "page_ComponentReview"
-        )
+        self.back_to_library_button: QPushButton = context.get("back_to_library_button")
+        self.button_PreviousStep: QPushButton = context.get("button_PreviousStep")
+        self.button_NextStep: QPushButton = context.get("button_NextStep")
+        # The review pages are built on their first visit (_ensure_review_page);
+        # until then the stack holds the .ui's empty placeholder for each
+        self._review_placeholders = {
+            name: pages.get(name) for name in REVIEW_PAGE_CLASSES if pages.get(name)
+        }
+        self.page_FootprintReview: Optional[FootprintReviewPage] = None
+        self.page_SymbolReview: Optional[SymbolReviewPage] = None
+        self.page_ComponentReview: Optional[ComponentReviewPage] = None
+        # Looked up once; _update_workflow_status runs on every part switch
+        self.workflow_status_labels = {
+            "footprint": context.get("label_step1_status"),
+            "symbol": context.get("label_step2_status"),
+            "assembly": context.get("label_step3_status"),
+            "finalize": context.get("label_step4_status"),
+        }
+        # (label, status attribute) pairs for the labels the UI actually has
+        self._workflow_entries = [
+            (self.workflow_status_labels[label_key], status_key)
+            for label_key, status_key in WORKFLOW_MAPPING.items()
+            if self.workflow_status_labels.get(label_key)
+        ]
+        self.step_labels = [context.get(f"step{i + 1}_Status") for i in range(4)]
         self._setup_hero_image()
 
     def _on_element_status_changed(self):
@@ -168,6 +189,8 @@ class LibraryElementPage(QWidget):
 
     def _setup_hero_image(self):
         self.hero_pixmap_item = QGraphicsPixmapItem()
+        # Cache the rasterized pixmap so panning is a blit, not a resample
+        self.hero_pixmap_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.hero_scene.addItem(self.hero_pixmap_item)
         self.hero_text_item = QGraphicsTextItem()
         font = QFont()
@@ -179,6 +202,9 @@ class LibraryElementPage(QWidget):
 
     def _set_hero_pixmap(self, pixmap: QPixmap):
         if pixmap and not pixmap.isNull():
+            # Nothing is painted until the deferred fit has set the final
+            # transform, so the new image never shows at the old zoom first
+            self.hero_view.setUpdatesEnabled(False)
             self.hero_pixmap_item.setPixmap(pixmap)
             self.hero_pixmap_item.setVisible(True)
             self.hero_text_item.setVisible(False)
@@ -187,71 +213,91 @@ class LibraryElementPage(QWidget):
             self._set_hero_text(UIText.IMAGE_NOT_AVAILABLE.value)
 
     def _fit_and_zoom_hero(self):
-        self.hero_view.fitInView(self.hero_pixmap_item, Qt.KeepAspectRatio)
-        self.hero_view.scale(1.5, 1.5)
-
-    def _setup_workers(self):
-        self.image_thread = QThread()
-        self.image_worker = ImageWorker(self.api_service)
-        self.image_worker.moveToThread(self.image_thread)
-        self.image_worker.image_loaded.connect(self.on_image_loaded)
-        self.image_worker.image_failed.connect(self.on_image_failed)
-        self.request_image.connect(self.image_worker.load_image)
-        self.image_thread.start()
+        # Text may have replaced the image since this fit was scheduled
+        if not self.hero_pixmap_item.isVisible():
+            self._hero_fit_pending = False
+            return
+        if not self.hero_view.isVisible():
+            # A fit now would use a viewport that has not been laid out;
+            # updates stay off until showEvent fits it
+            self._hero_fit_pending = True
+            return
+        self._hero_fit_pending = False
+        with batched_view_updates(self.hero_view):
+            self.hero_view.fit_to_item(self.hero_pixmap_item, 1.5)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._hero_fit_pending:
+            QTimer.singleShot(0, self._fit_and_zoom_hero)
 
     def _connect_signals(self):
         """Find and connect signals for workflow steps and navigation buttons."""
         logger.debug("Connecting signals for LibraryElementPage...")
-        self.step_labels = [
-            self.context_frame.findChild(ClickableLabel, f"step{i + 1}_Status")
-            for i in range(4)
-        ]
         self.step_label_text = [label.text() for label in self.step_labels if label]
+        self._active_step = -1
+        # Built once from the labels' own font so navigation only swaps them
+        base_font = next((label.font() for label in self.step_labels if label), QFont())
+        self._step_font_normal = QFont(base_font)
+        self._step_font_normal.setBold(False)
+        self._step_font_bold = QFont(base_font)
+        self._step_font_bold.setBold(True)
         logger.debug(f"Found {len(self.step_labels)} workflow step labels.")
 
         if self.button_PreviousStep:
-            self.button_PreviousStep.clicked.connect(self.previous_step)
+            self.button_PreviousStep.clicked.connect(
+                self.previous_step, Qt.UniqueConnection
+            )
             logger.debug("Connected 'Previous' button.")
         else:
             logger.warning("'button_PreviousStep' not found.")
 
         if self.button_NextStep:
-            self.button_NextStep.clicked.connect(self.next_step)
+            self.button_NextStep.clicked.connect(self.next_step, Qt.UniqueConnection)
             logger.debug("Connected 'Next' button.")
         else:
             logger.warning("'button_NextStep' not found.")
 
         if self.back_to_library_button:
-            self.back_to_library_button.clicked.connect(self.back_to_library_requested)
+            # Signal-to-signal relay on the GUI thread, so no Python slot runs
+            self.back_to_library_button.clicked.connect(
+                self.back_to_library_requested, Qt.DirectConnection
+            )
             logger.debug("Connected 'Back to Library' button.")
         else:
             logger.warning("'back_to_library_button' not found.")
 
+        # Connected once here; Qt.UniqueConnection cannot dedupe partials
         for i, label in enumerate(self.step_labels):
             if label:
                 label.clicked.connect(partial(self.go_to_step, i))
         logger.debug("Connected clickable step labels.")
 
-        if self.page_FootprintReview:
-            self.page_FootprintReview.status_changed.connect(
-                self._on_element_status_changed
-            )
-            logger.debug("Connected footprint status change signal.")
-
-        if self.page_SymbolReview:
-            self.page_SymbolReview.status_changed.connect(
-                self._on_element_status_changed
-            )
-            logger.debug("Connected symbol status change signal.")
+    def set_component(self, component):
+        """
+        Shows a part. A lone call applies at once; further calls within
+        SET_COMPONENT_DEBOUNCE_MS are coalesced so only the last part of a
+        burst starts image loads.
+        """
+        self._pending_component = component
+        if self._set_component_timer.isActive():
+            self._set_component_timer.start()
+            return
+        self._set_component_timer.start()
+        self._apply_pending_component()
 
-        if self.page_ComponentReview:
-            self.page_ComponentReview.status_changed.connect(
-                self._on_element_status_changed
-            )
-            logger.debug("Connected component status change signal.")
+    def _apply_pending_component(self):
+        component = self._pending_component
+        if component is None:
+            return
+        self._pending_component = None
+        self._do_set_component(component)
 
-    def set_component(self, component):
+    def _do_set_component(self, component):
         self.component = component
+        # Every image job started below carries this id; older results are dropped
+        self._image_request_id += 1
+        self._pending_images.clear()
         if self.part_info_widget:
             self.part_info_widget.set_component(component)
 
@@ -261,97 +307,205 @@ class LibraryElementPage(QWidget):
         # to get the local path.
         if hasattr(component, "image_url") and component.image_url:
             self._set_hero_text(UIText.LOADING.value)
+            self._hero_url = component.image_url
             try:
                 vendor_enum = Vendor(component.vendor)
-                self.request_image.emit(vendor_enum, component.image_url, "hero")
+                # Clicking back to a part whose hero is still downloading
+                # waits for that download instead of starting another
+                if not self._hero_download_in_flight(component.image_url):
+                    self._start_image_job(
+                        ImageWorker(
+                            self.api_service,
+                            vendor_enum,
+                            component.image_url,
+                            "hero",
+                            self._image_request_id,
+                        )
+                    )
             except ValueError:
                 self._set_hero_text(UIText.IMAGE_NOT_AVAILABLE.value)
         else:
-            hero_path = component.hero_image_path
-            if hero_path and hero_path.exists():
-                self._set_hero_pixmap(QPixmap(str(hero_path)))
-            else:
-                self._set_hero_text(UIText.IMAGE_NOT_AVAILABLE.value)
+            self._hero_url = None
+            self._load_local_hero(component.hero_image_path)
+
+        # Review pages are filled in when their step is first shown for this
+        # part; most visits never leave the first step.
+        self._pending_steps = {}
+        for name, populate in (
+            ("page_FootprintReview", self._populate_footprint_review),
+            ("page_SymbolReview", self._populate_symbol_review),
+            ("page_ComponentReview", self._populate_component_review),
+        ):
+            page = getattr(self, name) or self._review_placeholders.get(name)
+            if page:
+                index = self.review_stack.indexOf(page)
+                self._pending_steps[index] = partial(populate, component)
+
+        self._update_workflow_status(component.status)
+        self.go_to_step(0)
 
+    def _populate_footprint_review(self, component):
         # Use new properties to get paths
         if hasattr(component, "footprint") and component.footprint:
             fp_path = component.footprint.png_path
             rend_fp_path = component.footprint.rendered_png_path
-
-            footprint_pixmap = (
-                QPixmap(str(fp_path)) if fp_path and fp_path.exists() else QPixmap()
-            )
-            rendered_footprint_pixmap = (
-                QPixmap(str(rend_fp_path))
-                if rend_fp_path and rend_fp_path.exists()
-                else QPixmap()
-            )
         else:
-            footprint_pixmap = QPixmap()
-            rendered_footprint_pixmap = QPixmap()
-
-        self.page_FootprintReview.set_footprint_image(footprint_pixmap)
-        self.page_FootprintReview.set_library_part(component)
-        self.page_FootprintReview.set_librepcb_footprint_image(
-            rendered_footprint_pixmap
+            fp_path = rend_fp_path = None
+
+        self._load_review_images(
+            self.page_FootprintReview,
+            {
+                "footprint": (fp_path, self.page_FootprintReview.set_footprint_image),
+                "rendered_footprint": (
+                    rend_fp_path,
+                    self.page_FootprintReview.set_librepcb_footprint_image,
+                ),
+            },
         )
+        self.page_FootprintReview.set_library_part(component)
 
+    def _populate_symbol_review(self, component):
         if hasattr(component, "symbol") and component.symbol:
             sym_path = component.symbol.png_path
             rend_sym_path = component.symbol.rendered_png_path
-
-            symbol_pixmap = (
-                QPixmap(str(sym_path)) if sym_path and sym_path.exists() else QPixmap()
-            )
-            rendered_symbol_pixmap = (
-                QPixmap(str(rend_sym_path))
-                if rend_sym_path and rend_sym_path.exists()
-                else QPixmap()
-            )
         else:
-            symbol_pixmap = QPixmap()
-            rendered_symbol_pixmap = QPixmap()
-
-        self.page_SymbolReview.set_symbol_image(symbol_pixmap)
+            sym_path = rend_sym_path = None
+
+        self._load_review_images(
+            self.page_SymbolReview,
+            {
+                "symbol": (sym_path, self.page_SymbolReview.set_symbol_image),
+                "rendered_symbol": (
+                    rend_sym_path,
+                    self.page_SymbolReview.set_librepcb_symbol_image,
+                ),
+            },
+        )
         self.page_SymbolReview.set_library_part(component)
-        self.page_SymbolReview.set_librepcb_symbol_image(rendered_symbol_pixmap)
 
-        # Set up component review page
-        if self.page_ComponentReview:
-            self.page_ComponentReview.set_library_part(component)
-
-        self._update_workflow_status(component.status)
-        self.go_to_step(0)
+    def _populate_component_review(self, component):
+        self.page_ComponentReview.set_library_part(component)
 
     def _update_workflow_status(self, status):
         """Update the workflow status icons based on the component's status."""
-        workflow_status_labels = {
-            "footprint": self.context_frame.findChild(QLabel, "label_step1_status"),
-            "symbol": self.context_frame.findChild(QLabel, "label_step2_status"),
-            "assembly": self.context_frame.findChild(QLabel, "label_step3_status"),
-            "finalize": self.context_frame.findChild(QLabel, "label_step4_status"),
-        }
+        for label_widget, status_key in self._workflow_entries:
+            status_value = getattr(status, status_key, StatusValue.UNAVAILABLE)
+            label_widget.setText(status_value.icon)
 
-        for label_key, status_key in WORKFLOW_MAPPING.items():
-            label_widget = workflow_status_labels.get(label_key)
-            if label_widget:
-                status_value = getattr(status, status_key, StatusValue.UNAVAILABLE)
-                label_widget.setText(status_value.icon)
+    def cleanup(self):
+        """Stops a pending part switch; downloads end with the shared pool."""
+        self._set_component_timer.stop()
+
+    def _start_image_job(self, job: Union[ImageWorker, ImageFileWorker]):
+        # Held until the job reports back; its signal holder must outlive run()
+        self._image_jobs[(job.request_id, job.image_type)] = job
+        job.signals.image_loaded.connect(self.on_image_loaded)
+        job.signals.image_failed.connect(self.on_image_failed)
+        if isinstance(job, ImageWorker):
+            get_shared_download_pool().start(job)
+        else:
+            QThreadPool.globalInstance().start(job)
 
-    def on_image_loaded(self, image_data: bytes, image_type: str):
-        pixmap = QPixmap()
-        pixmap.loadFromData(image_data)
-        if image_type == "hero":
+    def _load_review_images(self, page, images: dict):
+        """
+        Sets a review page's previews from QPixmapCache where possible and
+        decodes the rest on the thread pool, showing a placeholder meanwhile.
+        `images` maps an image type to its (path, setter) pair.
+        """
+        max_side = _preview_decode_side(page)
+        hits = []
+        misses = []
+        for image_type, (path, setter) in images.items():
+            key = image_cache_key(path)
+            if key:
+                # Kept apart from decodes of the same file at other sizes
+                key = f"{key}:{max_side}"
+            pixmap = QPixmapCache.find(key) if key else QPixmap()
+            if pixmap is None:
+                misses.append((image_type, path, key, setter))
+            else:
+                hits.append((setter, pixmap))
+
+        if misses:
+            page.show_images_loading()
+        for setter, pixmap in hits:
+            setter(pixmap)
+        for image_type, path, key, setter in misses:
+            self._pending_images[image_type] = (key, setter)
+            self._start_image_job(
+                ImageFileWorker(path, image_type, self._image_request_id, max_side)
+            )
+
+    def _load_local_hero(self, path):
+        """
+        Shows a library part's hero from QPixmapCache, or decodes it at
+        preview size on the thread pool. Vendor photos are often far larger
+        than the sidebar, so the full-size image is never put on screen.
+        """
+        key = image_cache_key(path)
+        if key is None:
+            self._set_hero_text(UIText.IMAGE_NOT_AVAILABLE.value)
+            return
+        # Kept apart from a full-size pixmap of the same file
+        key = f"{key}:{HERO_PREVIEW_MAX_SIDE}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
             self._set_hero_pixmap(pixmap)
+            return
+        self._set_hero_text(UIText.LOADING.value)
+        self._pending_images["hero_file"] = (key, self._set_hero_pixmap)
+        self._start_image_job(
+            ImageFileWorker(
+                path, "hero_file", self._image_request_id, HERO_PREVIEW_MAX_SIDE
+            )
+        )
+
+    def _hero_download_in_flight(self, image_url: str) -> bool:
+        return any(
+            job.image_type == "hero" and job.image_url == image_url
+            for job in self._image_jobs.values()
+        )
 
-    def on_image_failed(self, error_message: str, image_type: str):
+    def on_image_loaded(
+        self, image: QImage, image_type: str, cache_path: str, request_id: int
+    ):
+        job = self._image_jobs.pop((request_id, image_type), None)
         if image_type == "hero":
-            self._set_hero_text(UIText.IMAGE_NOT_AVAILABLE.value)
+            # Matched by URL: the download may predate the current request
+            if job and job.image_url == self._hero_url:
+                self._set_hero_pixmap(QPixmap.fromImage(image))
+            return
+        if request_id != self._image_request_id:
+            return
+        pending = self._pending_images.pop(image_type, None)
+        if pending:
+            key, setter = pending
+            setter(cache_pixmap_from_image(key, image))
+
+    def on_image_failed(self, error_message: str, image_type: str, request_id: int):
+        job = self._image_jobs.pop((request_id, image_type), None)
+        if image_type == "hero":
+            if job and job.image_url == self._hero_url:
+                self._set_hero_text(UIText.IMAGE_NOT_AVAILABLE.value)
+            return
+        if request_id != self._image_request_id:
+            return
+        pending = self._pending_images.pop(image_type, None)
+        if pending:
+            pending[1](QPixmap())
 
     def go_to_step(self, index):
         """Navigate to a specific step in the review workflow."""
         logger.debug(f"Attempting to navigate to step {index + 1}.")
+        # Clicking the shown step is a no-op unless a new part still has to
+        # fill it in
+        if index == self._active_step and index not in self._pending_steps:
+            return
         if self.review_stack and 0 <= index < self.review_stack.count():
+            self._ensure_review_page(index)
+            populate = self._pending_steps.pop(index, None)
+            if populate:
+                populate()
             self.review_stack.setCurrentIndex(index)
             logger.info(
                 f"Navigated to workflow step {index + 1}: '{self.step_label_text[index]}'."
@@ -363,25 +517,45 @@ class LibraryElementPage(QWidget):
             if self.button_NextStep:
                 self.button_NextStep.setEnabled(index < self.review_stack.count() - 1)
 
-            # Update label styles
-            for i, label in enumerate(self.step_labels):
-                if label:
-                    is_active_step = i == index
-                    new_text = (
-                        f"<b>{self.step_label_text[i]}</b>"
-                        if is_active_step
-                        else self.step_label_text[i]
-                    )
-                    if label.text() != new_text:
-                        label.setText(new_text)
-                        logger.debug(
-                            f"Set step {i + 1} label to '{'bold' if is_active_step else 'plain'}'."
-                        )
+            # Only the previously active and the new step change weight; a
+            # font flip avoids re-parsing the label text as rich text.
+            if index != self._active_step:
+                self._set_step_label_bold(self._active_step, False)
+                self._set_step_label_bold(index, True)
+                self._active_step = index
         else:
             logger.warning(
                 f"Could not navigate to step {index + 1}: Index out of range or review_stack not found."
             )
 
+    def _ensure_review_page(self, index: int):
+        """Swaps the placeholder at index for its review page on first visit."""
+        placeholder = self.review_stack.widget(index)
+        name = placeholder.objectName()
+        if self._review_placeholders.get(name) is not placeholder:
+            return
+        page = REVIEW_PAGE_CLASSES[name]()
+        page.setObjectName(name)
+        self.review_stack.insertWidget(index, page)
+        self.review_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        del self._review_placeholders[name]
+        setattr(self, name, page)
+        page.status_changed.connect(
+            self._on_element_status_changed, Qt.UniqueConnection
+        )
+        logger.debug(f"Built review page {name}.")
+
+    def _set_step_label_bold(self, index: int, bold: bool):
+        if not 0 <= index < len(self.step_labels):
+            return
+        label = self.step_labels[index]
+        if label:
+            label.setFont(self._step_font_bold if bold else self._step_font_normal)
+            logger.debug(
+                f"Set step {index + 1} label to '{'bold' if bold else 'plain'}'."
+            )
+
     def next_step(self):
         if self.review_stack:
             self.go_to_step(self.review_stack.currentIndex() + 1)
@@ -390,14 +564,10 @@ class LibraryElementPage(QWidget):
         if self.review_stack:
             self.go_to_step(self.review_stack.currentIndex() - 1)
 
-    def cleanup(self):
-        if hasattr(self, "image_thread") and self.image_thread.isRunning():
-            self.image_thread.quit()
-            self.image_thread.wait()
-
     def _set_hero_text(self, text: str):
-        self.hero_text_item.setPlainText(text)
-        self.hero_text_item.setVisible(True)
-        self.hero_pixmap_item.setVisible(False)
-        self.hero_view.resetTransform()
-        self.hero_view.centerOn(self.hero_text_item)
+        with batched_view_updates(self.hero_view):
+            self.hero_text_item.setPlainText(text)
+            self.hero_text_item.setVisible(True)
+            self.hero_pixmap_item.setVisible(False)
+            self.hero_view.resetTransform()
+            self.hero_view.centerOn(self.hero_text_item)
@@ -1,11 +1,9 @@
 import logging
-import os
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
-from PySide6.QtCore import QObject, Qt, Signal, Slot, QThread
+from PySide6.QtCore import QObject, Qt, Signal, Slot, QThread, QTimer
 from PySide6.QtGui import QClipboard, QPixmap
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (
     QApplication,
     QDialog,
@@ -25,14 +23,29 @@ from adapters.search_engine import Vendor
 from library_manager import LibraryManager
 from models.library_part import LibraryPart
 from models.search_result import SearchResult
+from .custom_widgets import batched_tree_updates
 from .hero_image_widget import HeroImageWidget
 from .part_info_widget import PartInfoWidget
+from .pixmap_cache import cached_pixmap
+from .ui_loader import load_ui, named_children
 import constants as const
 
 from .ui_workers import AddPartWorker
 
 logger = logging.getLogger(__name__)
 
+# Previews are never scaled below this, even while their labels are smaller
+PREVIEW_MIN_SIDE = 250
+
+# Quiet period after a resize before previews are rescaled, so dragging the
+# window edge rescales once at the final size
+RESIZE_RESCALE_DEBOUNCE_MS = 50
+
+# A new preview is shown with a fast nearest-neighbour scale at once and
+# replaced by the smooth scale after this quiet period, so clicking through
+# results does not pay for a smooth downscale of every render
+SMOOTH_PREVIEW_DELAY_MS = 80
+
 
 # --- Add to Library Dialog ---
 class AddToLibraryDialog(QDialog):
@@ -128,8 +141,20 @@ class SearchPage(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._original_symbol_pixmap = None
-        self._original_footprint_pixmap = None
+        self._symbol_pixmap = None
+        self._footprint_pixmap = None
+        # Preview kind -> label size it was last scaled to
+        self._preview_sizes = {}
+        self._rescale_timer = QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.setInterval(RESIZE_RESCALE_DEBOUNCE_MS)
+        self._rescale_timer.timeout.connect(self._rescale_images)
+        # Preview kind -> new full-size pixmap still shown with the fast scale
+        self._pending_previews = {}
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(SMOOTH_PREVIEW_DELAY_MS)
+        self._smooth_timer.timeout.connect(self._apply_smooth_previews)
         self._current_search_result = None
         self.library_manager = LibraryManager()
         self._load_ui()
@@ -138,33 +163,26 @@ class SearchPage(QWidget):
         self.clear_images()
 
     def _load_ui(self):
-        loader = QUiLoader()
-        loader.registerCustomWidget(PartInfoWidget)
-        loader.registerCustomWidget(HeroImageWidget)
-        ui_file_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "page_search.ui"
+        self._loaded_ui = load_ui(
+            "page_search.ui", self, (PartInfoWidget, HeroImageWidget)
         )
-        loaded_ui = loader.load(ui_file_path, self)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(loaded_ui)
+        layout.addWidget(self._loaded_ui)
 
     def _find_widgets(self):
-        self.search_input = self.findChild(QLineEdit, "searchInput")
-        self.search_button = self.findChild(QPushButton, "button_Search")
-        self.add_to_library_button = self.findChild(
-            QPushButton, "add_to_library_button"
-        )
-        self.back_to_library_button = self.findChild(
-            QPushButton, "back_to_library_button"
-        )
-        self.results_tree = self.findChild(QTreeWidget, "searchResultsTree")
-        self.symbol_image_label = self.findChild(QLabel, "image_symbol")
-        self.footprint_image_label = self.findChild(QLabel, "image_footprint")
-        self.part_info_widget = self.findChild(PartInfoWidget, "part_info_widget")
-        self.hero_image_widget = self.findChild(HeroImageWidget, "hero_image_widget")
-        self.label_3dModelStatus = self.findChild(QLabel, "label_3dModelStatus")
-        self.datasheetLink = self.findChild(QLabel, "datasheetLink")
+        widgets = named_children(self._loaded_ui)
+        self.search_input: QLineEdit = widgets.get("searchInput")
+        self.search_button: QPushButton = widgets.get("button_Search")
+        self.add_to_library_button: QPushButton = widgets.get("add_to_library_button")
+        self.back_to_library_button: QPushButton = widgets.get("back_to_library_button")
+        self.results_tree: QTreeWidget = widgets.get("searchResultsTree")
+        self.symbol_image_label: QLabel = widgets.get("image_symbol")
+        self.footprint_image_label: QLabel = widgets.get("image_footprint")
+        self.part_info_widget: PartInfoWidget = widgets.get("part_info_widget")
+        self.hero_image_widget: HeroImageWidget = widgets.get("hero_image_widget")
+        self.label_3dModelStatus: QLabel = widgets.get("label_3dModelStatus")
+        self.datasheetLink: QLabel = widgets.get("datasheetLink")
         for label in [self.symbol_image_label, self.footprint_image_label]:
             if label:
                 label.setAlignment(Qt.AlignCenter)
@@ -203,49 +221,84 @@ class SearchPage(QWidget):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._rescale_images()
+        self._rescale_timer.start()
 
     def showEvent(self, event):
         super().showEvent(event)
-        from PySide6.QtCore import QTimer
-
         QTimer.singleShot(0, self._rescale_images)
 
     def _rescale_images(self):
+        if self._smooth_timer.isActive():
+            # The smooth pass is due shortly and rescales at the current size
+            return
+        self._show_preview("symbol", self.symbol_image_label, self._symbol_pixmap)
+        self._show_preview(
+            "footprint", self.footprint_image_label, self._footprint_pixmap
+        )
+
+    def _show_preview(self, kind: str, label: QLabel, pixmap: Optional[QPixmap]):
+        """
+        Scales a preview's working pixmap to fit its label, unless it was
+        already scaled to the label's current size.
+        """
+        if not label or not pixmap or pixmap.isNull():
+            return
+        size = self._preview_size(label)
+        if self._preview_sizes.get(kind) == size:
+            return
+        self._preview_sizes[kind] = size
+        label.setPixmap(
+            pixmap.scaled(*size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        )
+
+    def _show_fast_preview(self, kind: str, label: QLabel, pixmap: QPixmap):
+        """
+        Shows a new preview with a cheap nearest-neighbour scale and leaves
+        the smooth scale to _apply_smooth_previews once the selection settles.
+        """
+        label.setPixmap(
+            pixmap.scaled(
+                *self._preview_size(label), Qt.KeepAspectRatio, Qt.FastTransformation
+            )
+        )
+        self._pending_previews[kind] = pixmap
+        self._smooth_timer.start()
+
+    def _apply_smooth_previews(self):
+        pending, self._pending_previews = self._pending_previews, {}
+        if "symbol" in pending:
+            self._symbol_pixmap = self._working_pixmap(pending["symbol"])
+        if "footprint" in pending:
+            self._footprint_pixmap = self._working_pixmap(pending["footprint"])
+        self._rescale_images()
+
+    @staticmethod
+    def _preview_size(label: QLabel) -> tuple:
+        return (
+            max(label.width(), PREVIEW_MIN_SIDE),
+            max(label.height(), PREVIEW_MIN_SIDE),
+        )
+
+    @staticmethod
+    def _working_pixmap(pixmap: QPixmap) -> QPixmap:
         if (
-            self._original_symbol_pixmap
-            and not self._original_symbol_pixmap.isNull()
-            and self.symbol_image_label
-        ):
-            w = self.symbol_image_label.width()
-            h = self.symbol_image_label.height()
-            w = max(w, 250)
-            h = max(h, 250)
-            if w > 0 and h > 0:
-                self.symbol_image_label.setPixmap(
-                    self._original_symbol_pixmap.scaled(
-                        w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                    )
-                )
-        if (
-            self._original_footprint_pixmap
-            and not self._original_footprint_pixmap.isNull()
-            and self.footprint_image_label
+            pixmap.width() <= const.PREVIEW_WORKING_MAX_SIDE
+            and pixmap.height() <= const.PREVIEW_WORKING_MAX_SIDE
         ):
-            w = self.footprint_image_label.width()
-            h = self.footprint_image_label.height()
-            w = max(w, 250)
-            h = max(h, 250)
-            if w > 0 and h > 0:
-                self.footprint_image_label.setPixmap(
-                    self._original_footprint_pixmap.scaled(
-                        w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                    )
-                )
+            return pixmap
+        return pixmap.scaled(
+            const.PREVIEW_WORKING_MAX_SIDE,
+            const.PREVIEW_WORKING_MAX_SIDE,
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation,
+        )
 
     def clear_images(self):
-        self._original_symbol_pixmap = None
-        self._original_footprint_pixmap = None
+        self._symbol_pixmap = None
+        self._footprint_pixmap = None
+        self._preview_sizes.clear()
+        self._pending_previews.clear()
+        self._smooth_timer.stop()
         if self.symbol_image_label:
             self.symbol_image_label.clear()
             self.symbol_image_label.setText("Select a component to see its symbol")
@@ -275,13 +328,12 @@ class SearchPage(QWidget):
             self.item_selected.emit(None)
 
     def update_search_results(self, results: List[SearchResult]):
-        self.results_tree.currentItemChanged.disconnect(self.on_tree_item_selected)
-        self.results_tree.clear()
         if not results:
             item = QTreeWidgetItem(["No results found."])
             item.setDisabled(True)
-            self.results_tree.addTopLevelItem(item)
+            items = [item]
         else:
+            items = []
             for result in results:
                 item = QTreeWidgetItem(
                     [
@@ -292,8 +344,13 @@ class SearchPage(QWidget):
                     ]
                 )
                 item.setData(0, Qt.UserRole, result)
-                self.results_tree.addTopLevelItem(item)
-        self.results_tree.currentItemChanged.connect(self.on_tree_item_selected)
+                items.append(item)
+
+        # Refill in one call with repaints, sorting and the tree's own signals
+        # suspended, so clearing the old rows does not report a selection
+        with batched_tree_updates(self.results_tree):
+            self.results_tree.clear()
+            self.results_tree.addTopLevelItems(items)
 
     def set_symbol_loading(self, loading: bool):
         if loading and self.symbol_image_label:
@@ -304,41 +361,35 @@ class SearchPage(QWidget):
             self.footprint_image_label.setText("Loading...")
 
     def set_symbol_error(self, message: str):
+        self._preview_sizes.pop("symbol", None)
+        self._pending_previews.pop("symbol", None)
         if self.symbol_image_label:
             self.symbol_image_label.setText(f"Error:\n{message}")
 
     def set_footprint_error(self, message: str):
+        self._preview_sizes.pop("footprint", None)
+        self._pending_previews.pop("footprint", None)
         if self.footprint_image_label:
             self.footprint_image_label.setText(f"Error:\n{message}")
 
     def set_symbol_image(self, pixmap: QPixmap):
+        self._preview_sizes.pop("symbol", None)
+        self._pending_previews.pop("symbol", None)
+        self._symbol_pixmap = None
         if self.symbol_image_label:
             if not pixmap.isNull():
-                self._original_symbol_pixmap = pixmap
-                w = self.symbol_image_label.width()
-                h = self.symbol_image_label.height()
-                w = max(w, 250)
-                h = max(h, 250)
-                self.symbol_image_label.setPixmap(
-                    pixmap.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                )
+                self._show_fast_preview("symbol", self.symbol_image_label, pixmap)
             else:
-                self._original_symbol_pixmap = None
                 self.symbol_image_label.setText(const.UIText.IMAGE_NOT_AVAILABLE.value)
 
     def set_footprint_image(self, pixmap: QPixmap):
+        self._preview_sizes.pop("footprint", None)
+        self._pending_previews.pop("footprint", None)
+        self._footprint_pixmap = None
         if self.footprint_image_label:
             if not pixmap.isNull():
-                self._original_footprint_pixmap = pixmap
-                w = self.footprint_image_label.width()
-                h = self.footprint_image_label.height()
-                w = max(w, 250)
-                h = max(h, 250)
-                self.footprint_image_label.setPixmap(
-                    pixmap.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                )
+                self._show_fast_preview("footprint", self.footprint_image_label, pixmap)
             else:
-                self._original_footprint_pixmap = None
                 self.footprint_image_label.setText(
                     const.UIText.IMAGE_NOT_AVAILABLE.value
                 )
@@ -371,7 +422,7 @@ class SearchPage(QWidget):
                     self.hero_image_widget.show_image_not_available()
             elif result.hero_image_cache_path:
                 self.hero_image_widget.show_pixmap(
-                    QPixmap(result.hero_image_cache_path)
+                    cached_pixmap(result.hero_image_cache_path)
                 )
             else:
                 self.hero_image_widget.show_image_not_available()
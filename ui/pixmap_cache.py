@@ -0,0 +1,126 @@
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QSize, Qt
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+
+logger = logging.getLogger(__name__)
+
+
+def image_cache_key(path: Optional[Union[str, Path]]) -> Optional[str]:
+    """
+    QPixmapCache key for an image file: its path plus mtime, so a re-rendered
+    file gets a new key. Returns None if the file is missing.
+    """
+    if not path:
+        return None
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return f"{path}:{mtime_ns}"
+
+
+def cached_pixmap(path: Optional[Union[str, Path]]) -> QPixmap:
+    """
+    Loads an image file through QPixmapCache so flipping back to an element
+    does not decode its PNG again. The key includes the file's mtime, so a
+    re-rendered file is picked up. Returns a null pixmap if the file is missing.
+    """
+    key = image_cache_key(path)
+    if key is None:
+        return QPixmap()
+
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(str(path))
+        if pixmap.isNull():
+            logger.warning(f"Could not load image: {path}")
+        else:
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def cached_scaled_pixmap(path: Optional[Union[str, Path]], max_side: int) -> QPixmap:
+    """
+    Like cached_pixmap, but decodes the file straight to at most max_side
+    pixels per side and caches that copy apart from other sizes of the file.
+    """
+    key = image_cache_key(path)
+    if key is None:
+        return QPixmap()
+    key = f"{key}:{max_side}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = cache_pixmap_from_image(key, read_scaled_image(path, max_side))
+    return pixmap
+
+
+def cache_pixmap_from_image(key: str, image: QImage) -> QPixmap:
+    """
+    Wraps an image decoded on a worker thread and stores it under key, so the
+    next cached_pixmap() of the same file is a hit. GUI thread only.
+    """
+    pixmap = QPixmap.fromImage(image)
+    if not pixmap.isNull():
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def read_scaled_image(path: Optional[Union[str, Path]], max_side: int) -> QImage:
+    """
+    Decodes an image file straight to at most max_side pixels on its longer
+    edge, in the premultiplied format the raster paint engine draws fastest.
+    Works on a QImage, so it is safe to call from worker threads.
+    Returns a null image if the file is missing or unreadable.
+    """
+    if not path:
+        return QImage()
+    # No separate exists() check: a missing file just fails to open here
+    return _read_scaled(QImageReader(str(path)), QSize(max_side, max_side), path)
+
+
+def read_image_to_fit(path: Union[str, Path], bounds: Optional[QSize]) -> QImage:
+    """
+    Like read_scaled_image, but fits the image inside bounds (keeping its
+    aspect ratio). With no or empty bounds the image is read at full size.
+    """
+    return _read_scaled(QImageReader(str(path)), bounds, path)
+
+
+def decode_scaled_image(data: bytes, max_side: int) -> QImage:
+    """
+    Like read_scaled_image, for image data already in memory (e.g. a
+    download). Returns a null image if the data cannot be decoded.
+    """
+    if not data:
+        return QImage()
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QIODevice.ReadOnly)
+    return _read_scaled(
+        QImageReader(buffer), QSize(max_side, max_side), "downloaded image"
+    )
+
+
+def _read_scaled(reader: QImageReader, bounds: Optional[QSize], source) -> QImage:
+    size = reader.size()
+    if (
+        bounds
+        and not bounds.isEmpty()
+        and size.isValid()
+        and (size.width() > bounds.width() or size.height() > bounds.height())
+    ):
+        size.scale(bounds, Qt.KeepAspectRatio)
+        reader.setScaledSize(size)
+    image = reader.read()
+    if image.isNull():
+        if reader.error() != QImageReader.FileNotFoundError:
+            logger.warning(f"Could not read image {source}: {reader.errorString()}")
+        return image
+    # Convert once here instead of on every paint of the resulting pixmap
+    if image.format() != QImage.Format_ARGB32_Premultiplied:
+        image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    return image
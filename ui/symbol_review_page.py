@@ -1,14 +1,12 @@
 # ui/symbol_review_page.py
 import json
 import logging
-import os
 import subprocess
 import sys
 from typing import List, Tuple
 
-from PySide6.QtCore import Qt, QThread, QUrl, Signal
-from PySide6.QtGui import QDesktopServices, QPixmap
-from PySide6.QtUiTools import QUiLoader
+from PySide6.QtCore import Qt, QThreadPool, QUrl, Signal
+from PySide6.QtGui import QDesktopServices, QImage, QPixmap
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -22,17 +20,21 @@ from PySide6.QtWidgets import (
     QLabel,
 )
 
+from constants import UIText
 from models.elements import LibrePCBElement
 from models.status import (
     ElementManifest,
-    ValidationSeverity,
     ValidationMessage,
     StatusValue,
     ValidationSource,
 )
 from models.library_part import LibraryPart
 from library_manager import LibraryManager
-from .library_element_image_widget import LibraryElementImageWidget
+from .library_element_image_widget import (
+    LibraryElementImageWidget,
+    preview_target_size,
+)
+from .ui_loader import load_ui
 from .ui_workers import ElementUpdateWorker
 
 logger = logging.getLogger(__name__)
@@ -47,12 +49,7 @@ class SymbolReviewPage(QWidget):
         self.manifest = None
         self.library_manager = LibraryManager()
 
-        loader = QUiLoader()
-        loader.registerCustomWidget(LibraryElementImageWidget)
-        ui_file_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "symbol_review_page.ui"
-        )
-        self.ui = loader.load(ui_file_path, self)
+        self.ui = load_ui("symbol_review_page.ui", self, (LibraryElementImageWidget,))
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -201,17 +198,17 @@ class SymbolReviewPage(QWidget):
             self.uuid_label.setText(f'<a href="#">{uuid_str}</a>')
 
         manifest_path = LibrePCBElement.SYMBOL.get_wp_path(part.symbol.uuid)
-        if manifest_path.exists():
-            try:
-                self.manifest = ElementManifest.model_validate_json(
-                    manifest_path.read_text()
-                )
-            except (json.JSONDecodeError, ValueError) as e:
-                logger.error(f"Failed to parse symbol manifest {manifest_path}: {e}")
-                self.manifest = None
-        else:
+        try:
+            # Bytes go straight to pydantic's native JSON parser
+            self.manifest = ElementManifest.model_validate_json(
+                manifest_path.read_bytes()
+            )
+        except (FileNotFoundError, NotADirectoryError):
             logger.warning(f"Symbol manifest not found at {manifest_path}")
             self.manifest = None
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error(f"Failed to parse symbol manifest {manifest_path}: {e}")
+            self.manifest = None
         self._load_validation_messages()
         self._update_button_state()
 
@@ -219,6 +216,15 @@ class SymbolReviewPage(QWidget):
         if self.easyeda_preview:
             self.easyeda_preview.show_pixmap(pixmap)
 
+    def show_images_loading(self):
+        """
+        Shows a loading placeholder in both symbol views until their images
+        are set.
+        """
+        for view in (self.easyeda_preview, self.librepcb_preview):
+            if view:
+                view.show_text(UIText.LOADING.value)
+
     def set_librepcb_symbol_image(self, pixmap: QPixmap):
         if self.librepcb_preview:
             self.librepcb_preview.show_pixmap(pixmap)
@@ -229,33 +235,23 @@ class SymbolReviewPage(QWidget):
         self.refresh_button.setEnabled(False)
         self.refresh_button.setText("Refreshing...")
 
-        self.refresh_thread = QThread(self)
+        # Run on Qt's shared pool so repeated refreshes reuse warm threads;
+        # the reference keeps the worker's signal holder alive until it ends.
         self.refresh_worker = ElementUpdateWorker(
-            self.library_part, LibrePCBElement.SYMBOL
+            self.library_part,
+            LibrePCBElement.SYMBOL,
+            preview_target_size(self.librepcb_preview),
         )
-        self.refresh_worker.moveToThread(self.refresh_thread)
-        self.refresh_worker.update_complete.connect(self._on_update_complete)
-        self.refresh_worker.update_failed.connect(self._on_update_failed)
-        self.refresh_thread.started.connect(self.refresh_worker.run)
-        self.refresh_worker.finished.connect(self.refresh_thread.quit)
-        self.refresh_thread.finished.connect(self.refresh_thread.deleteLater)
-        self.refresh_worker.finished.connect(self.refresh_worker.deleteLater)
-        self.refresh_thread.start()
-
-    def _on_update_complete(self, png_path: str, issues: list):
-        if png_path:
-            self.set_librepcb_symbol_image(QPixmap(png_path))
-        self.library_manager._update_element_manifest(
+        self.refresh_worker.signals.update_complete.connect(self._on_update_complete)
+        self.refresh_worker.signals.update_failed.connect(self._on_update_failed)
+        QThreadPool.globalInstance().start(self.refresh_worker)
+
+    def _on_update_complete(self, image: QImage, issues: list):
+        if not image.isNull():
+            self.set_librepcb_symbol_image(QPixmap.fromImage(image))
+        self.manifest = self.library_manager._update_element_manifest(
             LibrePCBElement.SYMBOL, self.library_part.symbol.uuid, issues
         )
-        # We need to re-load the manifest from disk to get the latest changes
-        manifest_path = LibrePCBElement.SYMBOL.get_wp_path(
-            self.library_part.symbol.uuid
-        )
-        if manifest_path.exists():
-            self.manifest = ElementManifest.model_validate_json(
-                manifest_path.read_text()
-            )
         self._load_validation_messages()
         self.refresh_button.setEnabled(True)
         self.refresh_button.setText("Refresh Checks")
@@ -276,7 +272,7 @@ class SymbolReviewPage(QWidget):
         for index, msg in enumerate(self.manifest.validation):
             item = QTreeWidgetItem(self.symbol_message_list)
             item.setData(0, Qt.UserRole, index)
-            item.setText(1, self._get_icon_for_severity(msg.severity))
+            item.setText(1, msg.severity.icon)
             item.setTextAlignment(1, Qt.AlignCenter)
             item.setText(2, msg.message)
 
@@ -310,12 +306,3 @@ class SymbolReviewPage(QWidget):
             self.library_part, msg_index, is_checked
         )
         self.manifest.validation[msg_index].is_approved = is_checked
-
-    def _get_icon_for_severity(self, severity: ValidationSeverity) -> str:
-        if severity == ValidationSeverity.WARNING:
-            return "⚠️"
-        if severity == ValidationSeverity.HINT:
-            return "💡"
-        if severity == ValidationSeverity.ERROR:
-            return "❌"
-        return ""
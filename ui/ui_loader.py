@@ -0,0 +1,66 @@
+import logging
+import os
+from functools import lru_cache
+from typing import Optional, Sequence
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+from PySide6.QtUiTools import QUiLoader
+from PySide6.QtWidgets import QWidget
+
+logger = logging.getLogger(__name__)
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# One loader per set of registered custom widgets. Pages whose .ui files
+# nest each other register different sets, so a load never re-enters the
+# loader it is running on.
+_loaders = {}
+
+
+@lru_cache(maxsize=None)
+def _ui_bytes(file_name: str) -> QByteArray:
+    """Reads a .ui file from the ui package once per process."""
+    with open(os.path.join(UI_DIR, file_name), "rb") as f:
+        return QByteArray(f.read())
+
+
+def _loader_for(custom_widgets: tuple) -> QUiLoader:
+    loader = _loaders.get(custom_widgets)
+    if loader is None:
+        loader = QUiLoader()
+        for widget_class in custom_widgets:
+            loader.registerCustomWidget(widget_class)
+        _loaders[custom_widgets] = loader
+    return loader
+
+
+def load_ui(
+    file_name: str, parent: Optional[QWidget] = None, custom_widgets: Sequence = ()
+) -> Optional[QWidget]:
+    """
+    Builds the widget tree for a .ui file in the ui package, reusing the file's
+    cached contents and a shared QUiLoader with the given custom widgets.
+    """
+    buffer = QBuffer()
+    buffer.setData(_ui_bytes(file_name))
+    buffer.open(QIODevice.ReadOnly)
+    loader = _loader_for(tuple(custom_widgets))
+    widget = loader.load(buffer, parent)
+    buffer.close()
+    if widget is None:
+        logger.error(f"Failed to load {file_name}: {loader.errorString()}")
+    return widget
+
+
+def named_children(root: QWidget) -> dict:
+    """
+    Maps objectName to widget for everything under root, in one walk of the
+    tree rather than one findChild() walk per widget a page looks up.
+    If a name repeats, the first widget found keeps it.
+    """
+    named = {}
+    for child in root.findChildren(QWidget):
+        name = child.objectName()
+        if name:
+            named.setdefault(name, child)
+    return named
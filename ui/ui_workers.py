@@ -1,29 +1,62 @@
 # ui/ui_workers.py
 import logging
-from PySide6.QtCore import QObject, Signal, Slot
+from typing import Optional
+
+from PySide6.QtCore import QObject, QRunnable, QSize, QThreadPool, Signal, Slot
+from PySide6.QtGui import QImage
 
 from models.search_result import SearchResult
 from search import Search
 from models.library_part import LibraryPart
 from library_manager import LibraryManager
 from workers.element_renderer import render_and_check_element
+from constants import HERO_PREVIEW_MAX_SIDE, IMAGE_DOWNLOAD_THREADS
+from .pixmap_cache import decode_scaled_image, read_image_to_fit, read_scaled_image
+
+
+_shared_download_pool: Optional[QThreadPool] = None
+
 
+def get_shared_download_pool() -> QThreadPool:
+    """
+    Returns the process-wide pool for image downloads, creating it on first use.
+    Downloads wait on the network, so they are kept off the global pool that
+    decodes previews and renders elements.
+    """
+    global _shared_download_pool
+    if _shared_download_pool is None:
+        _shared_download_pool = QThreadPool()
+        _shared_download_pool.setObjectName("ImageDownloads")
+        _shared_download_pool.setMaxThreadCount(IMAGE_DOWNLOAD_THREADS)
+    return _shared_download_pool
 
-class ElementUpdateWorker(QObject):
+
+class ElementUpdateSignals(QObject):
     """
-    A worker to refresh an element's rendered image and validation checks.
+    Signals emitted by an ElementUpdateWorker. QRunnable is not a QObject,
+    so the worker carries an instance of this as its `signals` attribute.
     """
 
     finished = Signal()
-    update_complete = Signal(str, list)
+    update_complete = Signal(QImage, list)
     update_failed = Signal(str)
 
-    def __init__(self, part: LibraryPart, element_type):
+
+class ElementUpdateWorker(QRunnable):
+    """
+    A pooled task to refresh an element's rendered image and validation checks.
+    Start it with QThreadPool.globalInstance().start(worker).
+    """
+
+    def __init__(self, part: LibraryPart, element_type, target_size: QSize = None):
         super().__init__()
+        self.signals = ElementUpdateSignals()
         self._part = part
         self._element_type = element_type
+        # Snapshotted on the GUI thread; the rendered PNG is decoded and
+        # downscaled to this size here so the GUI thread only wraps it.
+        self._target_size = target_size
 
-    @Slot()
     def run(self):
         """
         Performs the long-running render and check operation.
@@ -34,20 +67,26 @@ class ElementUpdateWorker(QObject):
         try:
             png_path, issues = render_and_check_element(self._part, self._element_type)
             if png_path:
-                self.update_complete.emit(png_path, issues)
+                self.signals.update_complete.emit(self._load_image(png_path), issues)
             else:
                 # Still emit issues even if rendering fails
-                self.update_complete.emit("", issues)
-                self.update_failed.emit("Rendering failed, but checks may have run.")
+                self.signals.update_complete.emit(QImage(), issues)
+                self.signals.update_failed.emit(
+                    "Rendering failed, but checks may have run."
+                )
         except Exception as e:
             logger.error(
                 f"An exception occurred in ElementUpdateWorker: {e}", exc_info=True
             )
-            self.update_failed.emit(str(e))
+            self.signals.update_failed.emit(str(e))
         finally:
-            self.finished.emit()
+            self.signals.finished.emit()
             logger.info("ElementUpdateWorker finished.")
 
+    def _load_image(self, png_path: str) -> QImage:
+        """Decodes the rendered PNG straight to the target size."""
+        return read_image_to_fit(png_path, self._target_size)
+
 
 logger = logging.getLogger(__name__)
 
@@ -73,27 +112,91 @@ class SearchWorker(QObject):
             self.search_failed.emit(str(e))
 
 
-class ImageWorker(QObject):
+class ImageSignals(QObject):
+    """Signals emitted by an ImageWorker or ImageFileWorker."""
+
+    # A decoded QImage is implicitly shared, so crossing to the GUI thread
+    # copies a reference rather than the downloaded bytes
+    image_loaded = Signal(QImage, str, str, int)  # (image, type, cache path, id)
+    image_failed = Signal(str, str, int)  # (error, image type, request id)
+
+
+class ImageWorker(QRunnable):
     """
-    A QObject worker for loading images in a separate thread.
+    A pooled task that downloads and decodes one image.
+    Start it with get_shared_download_pool().start(worker); the request id is
+    passed back so the caller can drop results it no longer wants. The pool
+    does not delete it, so the caller can still tryTake() it while queued;
+    the caller releases it when its result arrives.
     """
 
-    image_loaded = Signal(bytes, str, str)
-    image_failed = Signal(str, str)
-
-    def __init__(self, api_service: Search):
+    def __init__(
+        self,
+        api_service: Search,
+        vendor,
+        image_url: str,
+        image_type: str,
+        request_id: int,
+    ):
         super().__init__()
+        self.setAutoDelete(False)
+        self.signals = ImageSignals()
         self._api_service = api_service
+        self._vendor = vendor
+        self.image_url = image_url
+        self.image_type = image_type
+        self.request_id = request_id
 
-    @Slot(object, str, str)
-    def load_image(self, vendor, image_url, image_type):
+    def run(self):
         try:
-            image_data, cache_path = self._api_service.download_image_from_url(
-                vendor, image_url
+            result = self._api_service.download_image_from_url(
+                self._vendor, self.image_url
+            )
+            if not result:
+                self._fail(f"Failed to download image: {self.image_url}")
+                return
+            image_data, cache_path = result
+            # Decoded here at preview size; QPixmap is made on the GUI thread
+            image = decode_scaled_image(image_data, HERO_PREVIEW_MAX_SIDE)
+            if image.isNull():
+                self._fail(f"Could not decode image: {self.image_url}")
+                return
+            self.signals.image_loaded.emit(
+                image, self.image_type, cache_path, self.request_id
             )
-            self.image_loaded.emit(image_data, image_type, cache_path)
         except Exception as e:
-            self.image_failed.emit(str(e), image_type)
+            logger.error(f"ImageWorker failed: {e}", exc_info=True)
+            self._fail(str(e))
+
+    def _fail(self, message: str):
+        self.signals.image_failed.emit(message, self.image_type, self.request_id)
+
+
+class ImageFileWorker(QRunnable):
+    """
+    A pooled task that decodes a local image to at most max_side pixels per
+    side. Start it with QThreadPool.globalInstance().start(worker); its
+    cache path is the file itself.
+    """
+
+    def __init__(self, path, image_type: str, request_id: int, max_side: int):
+        super().__init__()
+        self.signals = ImageSignals()
+        self.path = str(path)
+        self.image_type = image_type
+        self.request_id = request_id
+        self.max_side = max_side
+
+    def run(self):
+        image = read_scaled_image(self.path, self.max_side)
+        if image.isNull():
+            self.signals.image_failed.emit(
+                f"Could not read image: {self.path}", self.image_type, self.request_id
+            )
+        else:
+            self.signals.image_loaded.emit(
+                image, self.image_type, self.path, self.request_id
+            )
 
 
 class ComponentWorker(QObject):
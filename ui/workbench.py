@@ -5,15 +5,16 @@ import sys
 from typing import List
 
 from PySide6.QtCore import QObject, QThread, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import QApplication, QStackedWidget, QWidget
 
 from adapters.search_engine import Vendor
+from constants import PIXMAP_CACHE_LIMIT_KB, PREVIEW_WORKING_MAX_SIDE
 from library_manager import LibraryManager
 from models.library_part import LibraryPart
 from models.search_result import SearchResult
-from search import Search
+from search import get_shared_search
 
 from .custom_widgets import ClickableLabel
 from .footprint_review_page import FootprintReviewPage
@@ -23,8 +24,14 @@ from .page_library import LibraryPage
 from .page_library_element import LibraryElementPage
 from .page_search import SearchPage
 from .part_info_widget import PartInfoWidget
+from .pixmap_cache import cached_scaled_pixmap
 from .symbol_review_page import SymbolReviewPage
-from .ui_workers import ComponentWorker, ImageWorker, SearchWorker
+from .ui_workers import (
+    ComponentWorker,
+    ImageWorker,
+    SearchWorker,
+    get_shared_download_pool,
+)
 
 # Ensure SIGINT (Ctrl+C) quits the app properly
 signal.signal(signal.SIGINT, signal.SIG_DFL)
@@ -38,12 +45,11 @@ logger = logging.getLogger(__name__)
 class WorkbenchController(QObject):
     request_search = Signal(Vendor, str)
     request_hydration = Signal(SearchResult)
-    request_image = Signal(Vendor, str, str)
 
     def __init__(self, window):
         super().__init__()
         self.window = window
-        self.api_service = Search()
+        self.api_service = get_shared_search()
         self.library_manager = LibraryManager()
         self.current_search_result = None
         self.is_adding_to_library = False
@@ -54,6 +60,7 @@ class WorkbenchController(QObject):
 
     def _setup_workers(self):
         self.search_thread = QThread()
+        self.search_thread.setObjectName("SearchWorker")
         self.search_worker = SearchWorker(self.api_service)
         self.search_worker.moveToThread(self.search_thread)
         self.search_worker.search_completed.connect(self.on_search_completed)
@@ -61,15 +68,13 @@ class WorkbenchController(QObject):
         self.request_search.connect(self.search_worker.start_search)
         self.search_thread.start()
 
-        self.image_thread = QThread()
-        self.image_worker = ImageWorker(self.api_service)
-        self.image_worker.moveToThread(self.image_thread)
-        self.image_worker.image_loaded.connect(self.on_image_loaded)
-        self.image_worker.image_failed.connect(self.on_image_failed)
-        self.request_image.connect(self.image_worker.load_image)
-        self.image_thread.start()
+        # Images download on the shared pool; only the latest request's result
+        # is shown. Workers are held until they report back.
+        self._image_request_id = 0
+        self._image_workers = {}
 
         self.component_thread = QThread()
+        self.component_thread.setObjectName("ComponentWorker")
         self.component_worker = ComponentWorker(self.api_service)
         self.component_worker.moveToThread(self.component_thread)
         self.component_worker.hydration_completed.connect(self.on_hydration_completed)
@@ -133,8 +138,6 @@ class WorkbenchController(QObject):
         self.window.statusBar().showMessage("Search", 2000)
 
     def go_to_library_element(self):
-        if hasattr(self.page_LibraryElement, "cleanup"):
-            self.page_LibraryElement.cleanup()
         # Simply switch to the LibraryElementPage; details have been set by on_library_review_requested
         self.main_stack.setCurrentWidget(self.pages["library_element"])
         self.window.statusBar().showMessage("Entering review workflow", 2000)
@@ -179,18 +182,38 @@ class WorkbenchController(QObject):
         self.page_Search.set_search_button_text("Search")
 
     def on_request_image(self, vendor: Vendor, image_url: str, image_type: str):
-        self.request_image.emit(vendor, image_url, image_type)
-
-    def on_image_loaded(self, image_data: bytes, image_type: str, cache_path: str):
-        pixmap = QPixmap()
-        pixmap.loadFromData(image_data)
+        self._image_request_id += 1
+        download_pool = get_shared_download_pool()
+        # Downloads for results no longer selected that have not started yet
+        # are dropped; running ones finish and are ignored
+        for request_id, worker in list(self._image_workers.items()):
+            if download_pool.tryTake(worker):
+                del self._image_workers[request_id]
+        worker = ImageWorker(
+            self.api_service, vendor, image_url, image_type, self._image_request_id
+        )
+        worker.signals.image_loaded.connect(self.on_image_loaded)
+        worker.signals.image_failed.connect(self.on_image_failed)
+        self._image_workers[self._image_request_id] = worker
+        download_pool.start(worker)
+
+    def on_image_loaded(
+        self, image: QImage, image_type: str, cache_path: str, request_id: int
+    ):
+        self._image_workers.pop(request_id, None)
+        if request_id != self._image_request_id:
+            return
+        pixmap = QPixmap.fromImage(image)
         if image_type == "hero":
             if self.page_Search.hero_image_widget:
                 self.page_Search.hero_image_widget.show_pixmap(pixmap)
             if self.current_search_result:
                 self.current_search_result.hero_image_cache_path = cache_path
 
-    def on_image_failed(self, error_message: str, image_type: str):
+    def on_image_failed(self, error_message: str, image_type: str, request_id: int):
+        self._image_workers.pop(request_id, None)
+        if request_id != self._image_request_id:
+            return
         if image_type == "hero" and self.page_Search.hero_image_widget:
             self.page_Search.hero_image_widget.show_image_not_available()
 
@@ -201,15 +224,14 @@ class WorkbenchController(QObject):
             return
 
         self.current_search_result = result
+        # Revisiting a result reuses its decoded previews
         self.page_Search.set_symbol_image(
-            QPixmap(result.symbol_png_cache_path)
-            if result.symbol_png_cache_path
-            else QPixmap()
+            cached_scaled_pixmap(result.symbol_png_cache_path, PREVIEW_WORKING_MAX_SIDE)
         )
         self.page_Search.set_footprint_image(
-            QPixmap(result.footprint_png_cache_path)
-            if result.footprint_png_cache_path
-            else QPixmap()
+            cached_scaled_pixmap(
+                result.footprint_png_cache_path, PREVIEW_WORKING_MAX_SIDE
+            )
         )
         assets_loaded = (
             result.symbol_png_cache_path is not None
@@ -241,14 +263,21 @@ class WorkbenchController(QObject):
             self.request_hydration.emit(result)
 
     def cleanup(self):
-        for thread in [self.search_thread, self.component_thread, self.image_thread]:
+        for thread in [self.search_thread, self.component_thread]:
             if thread.isRunning():
                 thread.quit()
                 thread.wait()
+        # The pages run workers of their own
+        self.page_Library.cleanup()
+        self.page_LibraryElement.cleanup()
+        download_pool = get_shared_download_pool()
+        download_pool.clear()
+        download_pool.waitForDone()
 
 
 def main():
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
     loader = QUiLoader()
     loader.registerCustomWidget(LibraryPage)
     loader.registerCustomWidget(SearchPage)
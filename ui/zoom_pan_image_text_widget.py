@@ -3,6 +3,7 @@ import logging
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (
+    QGraphicsItem,
     QGraphicsPixmapItem,
     QGraphicsScene,
     QLabel,
@@ -20,6 +21,13 @@ class ZoomPanImageAndTextWidget(QWidget):
     def __init__(self, parent=None, zoom_factor=1.0):
         super().__init__(parent)
         self.zoom_factor = zoom_factor
+        self._fit_pending = False
+        # One reusable zero-delay timer, so a burst of show_pixmap calls
+        # coalesces into a single fit on the next event loop pass.
+        self._fit_timer = QTimer(self)
+        self._fit_timer.setSingleShot(True)
+        self._fit_timer.setInterval(0)
+        self._fit_timer.timeout.connect(self._fit_and_zoom)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -33,6 +41,8 @@ class ZoomPanImageAndTextWidget(QWidget):
         )
         self.view.setAlignment(Qt.AlignCenter)
         self.item = QGraphicsPixmapItem()
+        # Cache the rasterized pixmap so panning is a blit, not a resample
+        self.item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.scene.addItem(self.item)
         self.stack.addWidget(self.view)
 
@@ -56,12 +66,26 @@ class ZoomPanImageAndTextWidget(QWidget):
         self.scene.setSceneRect(self.item.boundingRect())
         self.stack.setCurrentWidget(self.view)
 
-        QTimer.singleShot(0, self._fit_and_zoom)
+        self._fit_timer.start()
 
     def _fit_and_zoom(self):
-        self.view.fitInView(self.item, Qt.KeepAspectRatio)
-        if self.zoom_factor != 1.0:
-            self.view.scale(self.zoom_factor, self.zoom_factor)
+        # Fitting a hidden or zero-sized view is wasted work; redo it once the
+        # widget is shown or resized.
+        if not self.view.isVisible() or self.view.viewport().rect().isEmpty():
+            self._fit_pending = True
+            return
+        self._fit_pending = False
+        self.view.fit_to_item(self.item, self.zoom_factor)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._fit_pending:
+            self._fit_timer.start()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._fit_pending:
+            self._fit_timer.start()
 
     def clear(self, default_text=""):
         self.show_text(default_text)